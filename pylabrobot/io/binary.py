@@ -19,6 +19,12 @@ from __future__ import annotations
 import struct
 from io import BytesIO
 
+# Packers are compiled once per (endianness, format) pair: building an f"{endian}B" format and
+# re-parsing it in struct.pack on every write is the dominant cost of the small write methods.
+_PACKERS = {
+  endian: {fmt: struct.Struct(endian + fmt).pack for fmt in "BHIQbhiqfd"} for endian in "<>"
+}
+
 
 class Writer:
   """Raw byte writer.
@@ -29,55 +35,56 @@ class Writer:
   def __init__(self, little_endian: bool = True):
     self._buffer = BytesIO()
     self._endian = "<" if little_endian else ">"
+    self._packers = _PACKERS[self._endian]
 
   def u8(self, value: int) -> "Writer":
     """Write unsigned 8-bit integer (0-255)."""
-    self._buffer.write(struct.pack(f"{self._endian}B", value))
+    self._buffer.write(self._packers["B"](value))
     return self
 
   def u16(self, value: int) -> "Writer":
     """Write unsigned 16-bit integer."""
-    self._buffer.write(struct.pack(f"{self._endian}H", value))
+    self._buffer.write(self._packers["H"](value))
     return self
 
   def u32(self, value: int) -> "Writer":
     """Write unsigned 32-bit integer."""
-    self._buffer.write(struct.pack(f"{self._endian}I", value))
+    self._buffer.write(self._packers["I"](value))
     return self
 
   def u64(self, value: int) -> "Writer":
     """Write unsigned 64-bit integer."""
-    self._buffer.write(struct.pack(f"{self._endian}Q", value))
+    self._buffer.write(self._packers["Q"](value))
     return self
 
   def i8(self, value: int) -> "Writer":
     """Write signed 8-bit integer (-128 to 127)."""
-    self._buffer.write(struct.pack(f"{self._endian}b", value))
+    self._buffer.write(self._packers["b"](value))
     return self
 
   def i16(self, value: int) -> "Writer":
     """Write signed 16-bit integer."""
-    self._buffer.write(struct.pack(f"{self._endian}h", value))
+    self._buffer.write(self._packers["h"](value))
     return self
 
   def i32(self, value: int) -> "Writer":
     """Write signed 32-bit integer."""
-    self._buffer.write(struct.pack(f"{self._endian}i", value))
+    self._buffer.write(self._packers["i"](value))
     return self
 
   def i64(self, value: int) -> "Writer":
     """Write signed 64-bit integer."""
-    self._buffer.write(struct.pack(f"{self._endian}q", value))
+    self._buffer.write(self._packers["q"](value))
     return self
 
   def f32(self, value: float) -> "Writer":
     """Write 32-bit float."""
-    self._buffer.write(struct.pack(f"{self._endian}f", value))
+    self._buffer.write(self._packers["f"](value))
     return self
 
   def f64(self, value: float) -> "Writer":
     """Write 64-bit double."""
-    self._buffer.write(struct.pack(f"{self._endian}d", value))
+    self._buffer.write(self._packers["d"](value))
     return self
 
   def string(self, value: str) -> "Writer":
@@ -91,6 +98,12 @@ class Writer:
     self._buffer.write(value)
     return self
 
+  def reset(self) -> "Writer":
+    """Clear the buffer so the writer can be reused."""
+    self._buffer.seek(0)
+    self._buffer.truncate()
+    return self
+
   def finish(self) -> bytes:
     """Return the built byte sequence."""
     return self._buffer.getvalue()
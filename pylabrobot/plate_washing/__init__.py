@@ -0,0 +1 @@
+from .biotek import BioTekEL406Backend
@@ -0,0 +1 @@
+from .el406 import BioTekEL406Backend
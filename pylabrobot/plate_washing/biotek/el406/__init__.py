@@ -0,0 +1,11 @@
+from .backend import BioTekEL406Backend
+from .enums import (
+  EL406Motor,
+  EL406MotorHomeType,
+  EL406PlateType,
+  EL406Sensor,
+  EL406StepType,
+  EL406SyringeManifold,
+  EL406WasherManifold,
+)
+from .errors import EL406CommunicationError
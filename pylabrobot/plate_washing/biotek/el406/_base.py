@@ -0,0 +1,194 @@
+"""Base mixin with shared send/receive machinery for EL406 step commands."""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from functools import cached_property
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple, TypeVar
+
+from pylabrobot.plate_washing.biotek.el406.enums import EL406PlateType, step_name_for
+from pylabrobot.plate_washing.biotek.el406.errors import EL406CommunicationError
+from pylabrobot.plate_washing.biotek.el406.helpers import plate_type_well_count
+from pylabrobot.plate_washing.biotek.el406.protocol import (
+  ACK_BYTES,
+  NAK_BYTES,
+  build_framed_message,
+)
+
+if TYPE_CHECKING:
+  from pylabrobot.io.ftdi import FTDI
+
+logger = logging.getLogger(__name__)
+
+_S = TypeVar("_S", bound="EL406StepsBaseMixin")
+
+
+class EL406StepsBaseMixin:
+  """Shared machinery for sending framed step commands to the EL406.
+
+  Concrete classes must provide ``io``, ``timeout``, ``plate_type`` and ``set_plate_type``.
+  """
+
+  # The batch state lives in slots; the concrete backend still keeps a __dict__ because
+  # MachineBackend and the rest of the machine stack are dict-based.
+  __slots__ = ("_in_batch", "_pending_frames")
+
+  io: "FTDI"
+  timeout: float
+  plate_type: EL406PlateType
+
+  # Pre-bound so step methods dispatch through one attribute instead of a module-global lookup
+  # per command build.
+  _build_framed_message = staticmethod(build_framed_message)
+
+  def __init__(self) -> None:
+    super().__init__()
+    self._in_batch = False
+    self._pending_frames: Optional[List[Tuple[bytes, float]]] = None
+
+  def set_plate_type(self, plate_type) -> None:
+    raise NotImplementedError
+
+  @cached_property
+  def _plate_wells(self) -> int:
+    """Well count for the current plate type.
+
+    Cached on the instance so mask encoders pay one attribute read per command instead of a
+    function call and dict lookup; ``set_plate_type`` drops the cached value.
+    """
+    return plate_type_well_count(self.plate_type)
+
+  @asynccontextmanager
+  async def batch(
+    self: _S, plate_type: EL406PlateType, coalesce_writes: bool = False
+  ) -> AsyncIterator[_S]:
+    """Group step commands that target the same plate type.
+
+    The plate type is applied for the duration of the block and restored afterwards.
+
+    With ``coalesce_writes`` the framed commands are collected instead of sent, written to the
+    device as one contiguous write when the block exits, and acknowledged back to back
+    afterwards. This drops the per-command transport round-trip; only use it for step
+    sequences that need no intermediate replies (e.g. dispense and shake runs). If the block
+    raises, the collected commands are discarded unsent.
+    """
+    previous_plate_type = self.plate_type
+    previous_in_batch = self._in_batch
+    previous_pending = self._pending_frames
+    self._in_batch = True
+    self.set_plate_type(plate_type)
+    pending: Optional[List[Tuple[bytes, float]]] = [] if coalesce_writes else previous_pending
+    self._pending_frames = pending
+    try:
+      yield self
+      if coalesce_writes and pending:
+        await self._flush_pending_frames(pending)
+    finally:
+      self._pending_frames = previous_pending
+      self.set_plate_type(previous_plate_type)
+      self._in_batch = previous_in_batch
+
+  async def _run_step(
+    self,
+    plate_type: EL406PlateType,
+    framed_message: bytes,
+    timeout: Optional[float] = None,
+  ) -> None:
+    """Send one step command for ``plate_type``.
+
+    Skips the ``batch`` context manager entirely: when the plate type is already pinned by an
+    active batch or already matches, the command is sent directly, and a one-shot send for a
+    different plate type inlines the set/restore instead of paying the asynccontextmanager
+    ``__aenter__``/``__aexit__`` coroutines for a single command.
+    """
+    if self._in_batch or plate_type == self.plate_type:
+      await self._send_step_command(framed_message, timeout=timeout)
+      return
+    previous_plate_type = self.plate_type
+    self.set_plate_type(plate_type)
+    try:
+      await self._send_step_command(framed_message, timeout=timeout)
+    finally:
+      self.set_plate_type(previous_plate_type)
+
+  async def _send_step_command(
+    self, framed_message: bytes, timeout: Optional[float] = None
+  ) -> None:
+    """Write a framed step command and wait for the instrument to acknowledge it.
+
+    Args:
+      framed_message: The complete framed message, as built by ``build_framed_message``.
+      timeout: How long to wait for the acknowledgement. Defaults to ``self.timeout``.
+
+    Raises:
+      EL406CommunicationError: If the instrument rejects the command or does not respond.
+    """
+    if timeout is None:
+      timeout = self.timeout
+
+    pending = self._pending_frames
+    if pending is not None:
+      pending.append((framed_message, timeout))
+      return
+
+    try:
+      await self.io.write(framed_message)
+    except OSError as e:
+      raise EL406CommunicationError(
+        f"Failed to write step command: {e}", operation="write", original_error=e
+      ) from e
+
+    t0 = time.time()
+    while True:
+      chunk = await self.io.read(1)
+      if chunk == ACK_BYTES:
+        return
+      if chunk == NAK_BYTES:
+        raise EL406CommunicationError(
+          f"Instrument rejected {step_name_for(framed_message[2])} step command "
+          f"{framed_message.hex()}",
+          operation="write",
+        )
+      if time.time() - t0 > timeout:
+        raise EL406CommunicationError(
+          f"Timeout while waiting for {step_name_for(framed_message[2])} acknowledgement",
+          operation="read",
+        )
+      if chunk == b"":
+        await asyncio.sleep(0.01)
+
+  async def _flush_pending_frames(self, pending: List[Tuple[bytes, float]]) -> None:
+    """Write the collected frames as one transport write, then read the acknowledgements.
+
+    The acknowledgement budget is the sum of the per-command timeouts; a NAK or timeout is
+    reported with the step name of the command it belongs to.
+    """
+    message = b"".join(frame for frame, _ in pending)
+    try:
+      await self.io.write(message)
+    except OSError as e:
+      raise EL406CommunicationError(
+        f"Failed to write batched step commands: {e}", operation="write", original_error=e
+      ) from e
+
+    budget = sum(timeout for _, timeout in pending)
+    t0 = time.time()
+    for framed_message, _ in pending:
+      while True:
+        chunk = await self.io.read(1)
+        if chunk == ACK_BYTES:
+          break
+        if chunk == NAK_BYTES:
+          raise EL406CommunicationError(
+            f"Instrument rejected {step_name_for(framed_message[2])} step command "
+            f"{framed_message.hex()}",
+            operation="write",
+          )
+        if time.time() - t0 > budget:
+          raise EL406CommunicationError(
+            f"Timeout while waiting for {step_name_for(framed_message[2])} acknowledgement",
+            operation="read",
+          )
+        if chunk == b"":
+          await asyncio.sleep(0.01)
@@ -0,0 +1,1273 @@
+"""Manifold (wash head) step commands for the BioTek EL406."""
+
+import functools
+import logging
+import struct
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pylabrobot.plate_washing.biotek.el406._base import EL406StepsBaseMixin
+from pylabrobot.plate_washing.biotek.el406._shake import INTENSITY_TO_BYTE
+from pylabrobot.plate_washing.biotek.el406.enums import EL406PlateType, EL406StepType
+from pylabrobot.plate_washing.biotek.el406.helpers import get_plate_type_wash_defaults
+from pylabrobot.plate_washing.biotek.el406.protocol import (
+  build_framed_message_with_header,
+  frame_header,
+)
+
+logger = logging.getLogger(__name__)
+
+# Manifold travel rates, in mm/s, to the rate byte sent to the firmware.
+TRAVEL_RATE_TO_BYTE: Dict[str, int] = {
+  "1": 0x01,
+  "2": 0x02,
+  "3": 0x03,
+  "4": 0x04,
+  "5": 0x05,
+  "6": 0x06,
+  "7": 0x07,
+  "8": 0x08,
+  "9": 0x09,
+  "10": 0x0A,
+}
+
+
+# Slot-indexed form of the table: the dict maps a rate to its position and the tuple holds the
+# wire bytes in that order, so the byte column can later be swapped (or dispatched via match)
+# without touching the lookup keys.
+_TRAVEL_RATE_INDEX = {rate: i for i, rate in enumerate(TRAVEL_RATE_TO_BYTE)}
+_TRAVEL_RATE_BYTES = tuple(TRAVEL_RATE_TO_BYTE.values())
+
+# Error text is precomputed so the failure path does not re-sort the keys per bad call.
+_TRAVEL_RATE_ERROR = "Invalid travel rate {!r}. Must be one of: " + ", ".join(
+  repr(r) for r in TRAVEL_RATE_TO_BYTE
+)
+_SHAKE_INTENSITY_ERROR = "Shake intensity must be one of {}, got {{!r}}".format(
+  ", ".join(repr(i) for i in INTENSITY_TO_BYTE)
+)
+
+
+def travel_rate_to_byte(rate: str) -> int:
+  """Convert a travel rate string to the byte sent to the firmware."""
+  index = _TRAVEL_RATE_INDEX.get(rate)
+  if index is None:
+    raise ValueError(_TRAVEL_RATE_ERROR.format(rate))
+  return _TRAVEL_RATE_BYTES[index]
+
+
+# Pre-compiled layouts for the fixed-size step payloads: one C-level pack call per build
+# replaces the per-field Writer method dispatches. "x" fields are the reserved (zero) regions.
+_WASH_STRUCT = struct.Struct("<BBBBHBBHHBbb7xHbbHB5xHHB8xHHB6xHHHHBHH4xHBH22x")
+_ASPIRATE_STRUCT = struct.Struct("<BBHBbbHBbbH2x2s4x")
+_DISPENSE_STRUCT = struct.Struct("<BBHBbbHH3x2s4x")
+_PRIME_STRUCT = struct.Struct("<BBHBH6x")
+_AUTO_CLEAN_STRUCT = struct.Struct("<BBH4x")
+assert _WASH_STRUCT.size == 102
+assert _ASPIRATE_STRUCT.size == 22
+assert _DISPENSE_STRUCT.size == 20
+assert _PRIME_STRUCT.size == 13
+assert _AUTO_CLEAN_STRUCT.size == 8
+
+# The dynamic wash fields (cycles, volumes, coordinates, delays, durations), packed into a
+# per-configuration template starting at byte 6; see _wash_builder. The "x" fields skip the
+# static bytes and reserved regions already present in the template.
+_WASH_DYN_STRUCT = struct.Struct("<BxHHBbb7xHbbH6xHH9xHH7xHHHHxHH4xHxH")
+_WASH_DYN_OFFSET = 6
+assert _WASH_DYN_OFFSET + _WASH_DYN_STRUCT.size == 80
+
+# Column mask selecting every column (12 bits set), shared by the manifold step payloads.
+_COLMASK_ALL = b"\xff\x0f"
+
+# Wire byte per buffer selector: lower case maps to the upper-case character, so builders do a
+# single dict probe instead of .upper() + ord() per call.
+_BUFFER_BYTE = {c: ord(c.upper()) for c in "ABCDabcd"}
+
+# Acknowledgement timeout budget for a wash: a fixed base plus a per-cycle allowance, on top of
+# the caller's shake and soak durations.
+_WASH_TIMEOUT_BASE = 120
+_WASH_TIMEOUT_PER_CYCLE = 60
+
+# Fully-resolved (dispense_volume, dispense_z, aspirate_z, secondary_z, final_secondary_z)
+# per plate type, for the common case where the caller overrides none of them.
+_WASH_DEFAULT_TUPLES = {
+  pt: (
+    defaults["dispense_volume"],
+    defaults["dispense_z"],
+    defaults["aspirate_z"],
+    defaults["aspirate_z"],
+    defaults["aspirate_z"],
+  )
+  for pt, defaults in ((pt, get_plate_type_wash_defaults(pt)) for pt in EL406PlateType)
+}
+
+
+# Builders specialized per wash configuration, keyed on the fields that rarely change between
+# the wash steps of one protocol. The cache stays small: one entry per distinct
+# plate/buffer/format/travel-rate combination seen.
+_WASH_BUILDER_CACHE: Dict[Tuple[int, ...], Callable[..., bytes]] = {}
+
+
+def _wash_builder(
+  plate_value: int,
+  bottom_flag: int,
+  final_flag: int,
+  format_byte: int,
+  sector_mask: int,
+  buffer_byte: int,
+  aspirate_travel_byte: int,
+  secondary_travel_byte: int,
+  final_travel_byte: int,
+  vacuum_flag: int,
+  intensity_byte: int,
+) -> Callable[..., bytes]:
+  """Return a wash payload builder specialized for one configuration.
+
+  Protocols usually repeat the same plate type, buffer, format and rate settings across many
+  wash steps, varying only volumes, coordinates and timings. Those static fields are baked
+  into a 102-byte template once per configuration; each build then copies the template and
+  patches just the dynamic fields with a single ``pack_into``.
+  """
+  key = (
+    plate_value,
+    bottom_flag,
+    final_flag,
+    format_byte,
+    sector_mask,
+    buffer_byte,
+    aspirate_travel_byte,
+    secondary_travel_byte,
+    final_travel_byte,
+    vacuum_flag,
+    intensity_byte,
+  )
+  builder = _WASH_BUILDER_CACHE.get(key)
+  if builder is None:
+    # All dynamic fields zeroed; they are overwritten on every build.
+    template = _WASH_STRUCT.pack(
+      plate_value,
+      bottom_flag,
+      final_flag,
+      format_byte,
+      sector_mask,
+      0,
+      buffer_byte,
+      0,
+      0,
+      0,
+      0,
+      0,
+      0,
+      0,
+      0,
+      0,
+      aspirate_travel_byte,
+      0,
+      0,
+      secondary_travel_byte,
+      0,
+      0,
+      final_travel_byte,
+      0,
+      0,
+      0,
+      0,
+      vacuum_flag,
+      0,
+      0,
+      0,
+      intensity_byte,
+      0,
+    )
+    pack_into = _WASH_DYN_STRUCT.pack_into
+
+    def builder(*dynamic: int) -> bytes:
+      buf = bytearray(template)
+      pack_into(buf, _WASH_DYN_OFFSET, *dynamic)
+      return bytes(buf)
+
+    _WASH_BUILDER_CACHE[key] = builder
+  return builder
+
+
+# Protocols typically reissue the same dispense/prime/auto-clean parameters across plates and
+# cycles, so the payloads are cached on their argument tuple; they are pure and at most 20 bytes.
+# The caches key on the public-form selectors (enum member, buffer string) so repeated steps
+# skip the .value / wire-byte resolution entirely: it only runs on a cache miss.
+@functools.lru_cache(maxsize=256)
+def _dispense_payload(
+  plate_type: EL406PlateType,
+  buffer: str,
+  volume: int,
+  flow_rate: int,
+  dispense_x: int,
+  dispense_y: int,
+  dispense_z: int,
+  pre_dispense_volume: int,
+) -> bytes:
+  return _DISPENSE_STRUCT.pack(
+    plate_type.value,
+    _BUFFER_BYTE[buffer],
+    volume,
+    flow_rate,
+    dispense_x,
+    dispense_y,
+    dispense_z,
+    pre_dispense_volume,
+    _COLMASK_ALL,
+  )
+
+
+@functools.lru_cache(maxsize=256)
+def _prime_payload(
+  plate_type: EL406PlateType, buffer: str, volume: int, flow_rate: int, duration: int
+) -> bytes:
+  return _PRIME_STRUCT.pack(plate_type.value, _BUFFER_BYTE[buffer], volume, flow_rate, duration)
+
+
+@functools.lru_cache(maxsize=256)
+def _auto_clean_payload(plate_type: EL406PlateType, buffer: str, duration_min: int) -> bytes:
+  return _AUTO_CLEAN_STRUCT.pack(plate_type.value, _BUFFER_BYTE[buffer], duration_min)
+
+
+# Frame prefixes for the fixed-size step payloads, resolved once at import.
+_ASPIRATE_HEADER = frame_header(EL406StepType.MANIFOLD_ASPIRATE.value, 22)
+_DISPENSE_HEADER = frame_header(EL406StepType.MANIFOLD_DISPENSE.value, 20)
+_WASH_HEADER = frame_header(EL406StepType.MANIFOLD_WASH.value, 102)
+
+# Validation error templates, interned once at import; .format only runs on the error branch.
+_ERR_RANGE = "{} must be {}-{}, got {}"
+_ERR_ASPIRATE_DELAY = "Aspirate delay must be 0-65.535 seconds, got {}"
+_ERR_WASH_CYCLES = "Wash cycles must be 1-10, got {}"
+_ERR_SECONDARY_Z = "Secondary aspirate Z offset must be 1-210, got {}"
+_ERR_FINAL_Z = "Final aspirate Z offset must be 1-210, got {}"
+_ERR_BOTTOM_WASH_VOLUME = "Bottom wash volume must be 0-3000 uL, got {}"
+_ERR_PRE_DISPENSE_VOLUME = "Pre-dispense volume must be 0-3000 uL, got {}"
+_ERR_MID_CYCLE_VOLUME = "Mid-cycle volume must be 0-3000 uL, got {}"
+_ERR_LOW_FLOW_VOLUME = "Low-flow volume must be 0-3000 uL, got {}"
+_ERR_VACUUM_TIME = "Vacuum time must be 5-999 seconds, got {}"
+_ERR_VACUUM_DELAY = "Vacuum delay must be 0-65.535 seconds, got {}"
+_ERR_SHAKE_DURATION = "Shake duration must be 0-600 seconds, got {}"
+_ERR_SOAK_DURATION = "Soak duration must be 0-600 seconds, got {}"
+_ERR_WASH_FORMAT = 'Wash format must be "Plate" or "Sector", got {!r}'
+_ERR_SECTORS = "Sectors/quadrants must be 1-4 and non-empty, got {}"
+_ERR_PRIME_VOLUME = "Prime volume must be 10-3000 uL, got {}"
+_ERR_PRIME_FLOW_RATE = "Prime flow rate must be 1-9, got {}"
+_ERR_PRIME_DURATION = "Prime duration must be 0-600 seconds, got {}"
+_ERR_AUTO_CLEAN_DURATION = "Auto-clean duration must be 1-60 minutes, got {}"
+_ERR_BUFFER = 'Buffer must be one of "A", "B", "C", "D", got {!r}'
+
+
+# Both cases are listed so the happy path is one membership probe with no .upper() allocation.
+_VALID_BUFFERS = frozenset({"A", "B", "C", "D", "a", "b", "c", "d"})
+
+
+def validate_buffer(buffer: str) -> None:
+  """Validate a wash buffer selector ("A" through "D", case insensitive)."""
+  if buffer not in _VALID_BUFFERS:
+    raise ValueError(_ERR_BUFFER.format(buffer))
+
+
+# Range specs as (label, lo, hi) tuples, checked by _check_ranges. One table-driven loop
+# replaces a chain of per-field comparisons (roughly twenty per wash call).
+_ASPIRATE_OFFSETS_SPEC = (
+  ("Aspirate X offset", -60, 60),
+  ("Aspirate Y offset", -40, 40),
+  ("Aspirate Z offset", 1, 210),
+)
+
+_DISPENSE_PARAMS_SPEC = (
+  ("Dispense volume (uL)", 25, 3000),
+  ("Dispense flow rate", 1, 9),
+  ("Dispense X offset", -60, 60),
+  ("Dispense Y offset", -40, 40),
+  ("Dispense Z offset", 1, 210),
+  ("Pre-dispense volume (uL)", 0, 3000),
+)
+
+
+def _check_ranges(values, spec) -> None:
+  """Check each value against its (label, lo, hi) spec entry.
+
+  Message formatting happens only in the raise branch, so the valid path does no string work.
+  The chained comparison is kept over an OR-of-differences sign test: values may be floats
+  (the builders truncate them), which the bitwise OR would reject with a TypeError.
+  """
+  for value, (label, lo, hi) in zip(values, spec):
+    if not lo <= value <= hi:
+      raise ValueError(_ERR_RANGE.format(label, lo, hi, value))
+
+
+# Module-level validators: callers bind them with one global lookup instead of walking the MRO
+# and building a bound method per call.
+
+
+def _validate_aspirate_mode_params(travel_rate: str, delay: float) -> None:
+  travel_rate_to_byte(travel_rate)  # single dict probe validates and raises on bad input
+  if not 0 <= delay <= 65.535:
+    raise ValueError(_ERR_ASPIRATE_DELAY.format(delay))
+
+
+def _validate_aspirate_offsets(x: int, y: int, z: int) -> None:
+  _check_ranges((x, y, z), _ASPIRATE_OFFSETS_SPEC)
+
+
+def _validate_dispense_params(
+  buffer: str,
+  volume: int,
+  flow_rate: int,
+  x: int,
+  y: int,
+  z: int,
+  pre_dispense_volume: int,
+) -> None:
+  validate_buffer(buffer)
+  _check_ranges((volume, flow_rate, x, y, z, pre_dispense_volume), _DISPENSE_PARAMS_SPEC)
+
+
+def _validate_wash_params(
+  plate_type: EL406PlateType,
+  cycles: int,
+  buffer: str,
+  dispense_volume: Optional[int],
+  dispense_z: Optional[int],
+  dispense_flow_rate: int,
+  dispense_x: int,
+  dispense_y: int,
+  aspirate_z: Optional[int],
+  aspirate_x: int,
+  aspirate_y: int,
+  aspirate_delay: float,
+  aspirate_travel_rate: str,
+  secondary_aspirate: bool,
+  secondary_z: Optional[int],
+  secondary_delay: float,
+  secondary_travel_rate: str,
+  final_aspirate: bool,
+  final_secondary_z: Optional[int],
+  final_aspirate_delay: float,
+  final_travel_rate: str,
+  bottom_wash: bool,
+  bottom_wash_volume: int,
+  pre_dispense_volume: int,
+  mid_cycle_volume: int,
+  low_flow_volume: int,
+  vacuum_filtration: bool,
+  vacuum_time: float,
+  vacuum_delay: float,
+  shake_duration: int,
+  shake_intensity: str,
+  soak_duration: int,
+) -> Tuple[int, int, int, int, int]:
+  """Validate all wash parameters and return the resolved defaults.
+
+  Deliberately one flat function: the previous five-layer helper chain re-marshalled a dozen
+  arguments into a fresh frame per layer on every wash. Only the validators shared with
+  :meth:`manifold_aspirate` and :meth:`manifold_dispense` remain separate calls.
+  """
+  if (
+    dispense_volume is None
+    and dispense_z is None
+    and aspirate_z is None
+    and secondary_z is None
+    and final_secondary_z is None
+  ):
+    # common case: no overrides, one dict probe for the precomputed tuple
+    dispense_volume, dispense_z, aspirate_z, secondary_z, final_secondary_z = _WASH_DEFAULT_TUPLES[
+      plate_type
+    ]
+  else:
+    # One defaults fetch and one probe per key; the aspirate height default backs three params.
+    pt_defaults = get_plate_type_wash_defaults(plate_type)
+    aspirate_z_default = pt_defaults["aspirate_z"]
+    if dispense_volume is None:
+      dispense_volume = pt_defaults["dispense_volume"]
+    if dispense_z is None:
+      dispense_z = pt_defaults["dispense_z"]
+    if aspirate_z is None:
+      aspirate_z = aspirate_z_default
+    if secondary_z is None:
+      secondary_z = aspirate_z_default
+    if final_secondary_z is None:
+      final_secondary_z = aspirate_z_default
+
+  if not 1 <= cycles <= 10:
+    raise ValueError(_ERR_WASH_CYCLES.format(cycles))
+  _validate_dispense_params(
+    buffer, dispense_volume, dispense_flow_rate, dispense_x, dispense_y, dispense_z, 0
+  )
+  _validate_aspirate_offsets(aspirate_x, aspirate_y, aspirate_z)
+  _validate_aspirate_mode_params(aspirate_travel_rate, aspirate_delay)
+
+  if secondary_aspirate:
+    if not 1 <= secondary_z <= 210:
+      raise ValueError(_ERR_SECONDARY_Z.format(secondary_z))
+    _validate_aspirate_mode_params(secondary_travel_rate, secondary_delay)
+  if final_aspirate:
+    if not 1 <= final_secondary_z <= 210:
+      raise ValueError(_ERR_FINAL_Z.format(final_secondary_z))
+    _validate_aspirate_mode_params(final_travel_rate, final_aspirate_delay)
+
+  if bottom_wash and not 0 <= bottom_wash_volume <= 3000:
+    raise ValueError(_ERR_BOTTOM_WASH_VOLUME.format(bottom_wash_volume))
+  if not 0 <= pre_dispense_volume <= 3000:
+    raise ValueError(_ERR_PRE_DISPENSE_VOLUME.format(pre_dispense_volume))
+  if not 0 <= mid_cycle_volume <= 3000:
+    raise ValueError(_ERR_MID_CYCLE_VOLUME.format(mid_cycle_volume))
+  if not 0 <= low_flow_volume <= 3000:
+    raise ValueError(_ERR_LOW_FLOW_VOLUME.format(low_flow_volume))
+
+  if vacuum_filtration:
+    if not 5 <= vacuum_time <= 999:
+      raise ValueError(_ERR_VACUUM_TIME.format(vacuum_time))
+    if not 0 <= vacuum_delay <= 65.535:
+      raise ValueError(_ERR_VACUUM_DELAY.format(vacuum_delay))
+  if not 0 <= shake_duration <= 600:
+    raise ValueError(_ERR_SHAKE_DURATION.format(shake_duration))
+  if shake_duration > 0 and shake_intensity not in INTENSITY_TO_BYTE:
+    raise ValueError(_SHAKE_INTENSITY_ERROR.format(shake_intensity))
+  if not 0 <= soak_duration <= 600:
+    raise ValueError(_ERR_SOAK_DURATION.format(soak_duration))
+
+  return dispense_volume, dispense_z, aspirate_z, secondary_z, final_secondary_z
+
+
+class EL406ManifoldStepsMixin(EL406StepsBaseMixin):
+  """Manifold aspirate, dispense, wash, prime and auto-clean steps."""
+
+  __slots__ = ()
+
+  def _build_aspirate_command(
+    self,
+    plate_type: EL406PlateType,
+    travel_rate: str,
+    aspirate_z: int,
+    aspirate_x: int,
+    aspirate_y: int,
+    delay_ms: int,
+    secondary_aspirate: bool,
+    secondary_x: int,
+    secondary_y: int,
+    secondary_z: int,
+  ) -> bytes:
+    """Build the 22-byte manifold aspirate payload.
+
+    Layout (little endian): plate type, travel rate, aspirate z (u16), reserved, x (i8), y (i8),
+    delay ms (u16), secondary flag, secondary x (i8), secondary y (i8), secondary z (u16),
+    2 reserved bytes, full column mask (2 bytes), 4 reserved bytes.
+    """
+    return _ASPIRATE_STRUCT.pack(
+      plate_type.value,
+      travel_rate_to_byte(travel_rate),
+      aspirate_z,
+      0x00,
+      aspirate_x,
+      aspirate_y,
+      delay_ms,
+      0x01 if secondary_aspirate else 0x00,
+      secondary_x,
+      secondary_y,
+      secondary_z,
+      _COLMASK_ALL,
+    )
+
+  def _build_dispense_command(
+    self,
+    plate_type: EL406PlateType,
+    buffer: str,
+    volume: int,
+    flow_rate: int,
+    dispense_x: int,
+    dispense_y: int,
+    dispense_z: int,
+    pre_dispense_volume: int,
+  ) -> bytes:
+    """Build the 20-byte manifold dispense payload.
+
+    Layout (little endian): plate type, buffer char, volume uL (u16), flow rate, x (i8), y (i8),
+    z (u16), pre-dispense volume (u16), reserved, 2 reserved bytes, full column mask (2 bytes),
+    4 reserved bytes.
+    """
+    pre_disp_vol = max(0, int(pre_dispense_volume))
+    return _dispense_payload(
+      plate_type,
+      buffer,
+      int(volume),
+      flow_rate,
+      dispense_x,
+      dispense_y,
+      dispense_z,
+      pre_disp_vol,
+    )
+
+  def _build_wash_composite_command(
+    self,
+    plate_type: EL406PlateType,
+    cycles: int,
+    buffer: str,
+    dispense_volume: int,
+    dispense_z: int,
+    dispense_flow_rate: int,
+    dispense_x: int,
+    dispense_y: int,
+    aspirate_z: int,
+    aspirate_x: int,
+    aspirate_y: int,
+    aspirate_delay: float,
+    aspirate_travel_rate: str,
+    secondary_aspirate: bool,
+    secondary_z: int,
+    secondary_delay: float,
+    secondary_travel_rate: str,
+    final_aspirate: bool,
+    final_secondary_z: int,
+    final_aspirate_delay: float,
+    final_travel_rate: str,
+    bottom_wash: bool,
+    bottom_wash_volume: int,
+    pre_dispense_volume: int,
+    mid_cycle_volume: int,
+    low_flow_volume: int,
+    vacuum_filtration: bool,
+    vacuum_time: float,
+    vacuum_delay: float,
+    wash_format: str,
+    sector_mask: int,
+    shake_duration: int,
+    shake_intensity: str,
+    soak_duration: int,
+  ) -> bytes:
+    """Build the 102-byte composite wash payload.
+
+    Layout (little endian)::
+
+      0   plate type
+      1   bottom wash flag
+      2   final aspirate flag
+      3   wash format (Plate=0, Sector=1)
+      4   sector mask (u16)
+      6   cycles
+      7   buffer char
+      8   dispense volume uL (u16)
+      10  dispense z (u16)
+      12  dispense flow rate
+      13  dispense x (i8)
+      14  dispense y (i8)
+      15  7 reserved bytes
+      22  aspirate z (u16)
+      24  aspirate x (i8)
+      25  aspirate y (i8)
+      26  aspirate delay ms (u16)
+      28  aspirate travel rate
+      29  5 reserved bytes
+      34  secondary z (u16)
+      36  secondary delay ms (u16)
+      38  secondary travel rate
+      39  8 reserved bytes
+      47  final secondary z (u16)
+      49  final aspirate delay ms (u16)
+      51  final travel rate
+      52  6 reserved bytes
+      58  bottom wash volume uL (u16)
+      60  pre-dispense volume uL (u16)
+      62  mid-cycle volume uL (u16)
+      64  low-flow volume uL (u16)
+      66  vacuum filtration flag
+      67  vacuum time s (u16)
+      69  vacuum delay ms (u16)
+      71  4 reserved bytes
+      75  shake duration s (u16)
+      77  shake intensity
+      78  soak duration s (u16)
+      80  4 reserved bytes
+      84  18 reserved bytes
+    """
+    bw_vol = int(bottom_wash_volume) if bottom_wash_volume > 0 else int(dispense_volume)
+    pre_disp = max(0, int(pre_dispense_volume))
+    midcyc_vol = max(0, int(mid_cycle_volume))
+    lf_vol = max(0, int(low_flow_volume))
+    # int(x + 0.5) rounds half up without round()'s banker's-rounding machinery; every
+    # duration here is validated nonnegative.
+    vac_delay = max(0, int(vacuum_delay * 1000 + 0.5))
+    # Direct indexing: the intensity string is validated upstream whenever shake_duration > 0,
+    # so a silent fallback here could only mask a bug.
+    intensity_byte = INTENSITY_TO_BYTE[shake_intensity] if shake_duration > 0 else 0x00
+
+    builder = _wash_builder(
+      plate_type.value,
+      0x01 if bottom_wash else 0x00,
+      0x01 if final_aspirate else 0x00,
+      0x01 if wash_format == "Sector" else 0x00,
+      sector_mask,
+      _BUFFER_BYTE[buffer],
+      travel_rate_to_byte(aspirate_travel_rate),
+      travel_rate_to_byte(secondary_travel_rate) if secondary_aspirate else 0x00,
+      travel_rate_to_byte(final_travel_rate) if final_aspirate else 0x00,
+      0x01 if vacuum_filtration else 0x00,
+      intensity_byte,
+    )
+    data = builder(
+      cycles,
+      int(dispense_volume),
+      dispense_z,
+      dispense_flow_rate,
+      dispense_x,
+      dispense_y,
+      aspirate_z,
+      aspirate_x,
+      aspirate_y,
+      int(aspirate_delay * 1000 + 0.5),
+      secondary_z if secondary_aspirate else 0,
+      int(secondary_delay * 1000 + 0.5) if secondary_aspirate else 0,
+      final_secondary_z if final_aspirate else 0,
+      int(final_aspirate_delay * 1000 + 0.5) if final_aspirate else 0,
+      bw_vol if bottom_wash else 0,
+      pre_disp,
+      midcyc_vol,
+      lf_vol,
+      int(vacuum_time + 0.5) if vacuum_filtration else 0,
+      vac_delay if vacuum_filtration else 0,
+      shake_duration,
+      soak_duration,
+    )
+
+    # length is structurally guaranteed: _WASH_STRUCT.size is asserted at import
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug("Wash command data (%d bytes): %s", len(data), data.hex())
+    return data
+
+  def _build_manifold_prime_command(
+    self,
+    plate_type: EL406PlateType,
+    buffer: str,
+    volume: int,
+    flow_rate: int,
+    duration: int,
+  ) -> bytes:
+    """Build the 13-byte manifold prime payload.
+
+    Layout (little endian): plate type, buffer char, volume uL (u16), flow rate,
+    duration s (u16), 6 reserved bytes.
+    """
+    return _prime_payload(plate_type, buffer, int(volume), flow_rate, duration)
+
+  def _build_auto_clean_command(
+    self,
+    plate_type: EL406PlateType,
+    buffer: str,
+    duration_min: int,
+  ) -> bytes:
+    """Build the 8-byte manifold auto-clean payload.
+
+    Layout (little endian): plate type, buffer char, duration min (u16), 4 reserved bytes.
+    """
+    return _auto_clean_payload(plate_type, buffer, duration_min)
+
+  def _prepare_aspirate_step(
+    self,
+    plate_type: EL406PlateType,
+    aspirate_z: Optional[int] = None,
+    aspirate_x: int = 0,
+    aspirate_y: int = 0,
+    delay: float = 0.0,
+    travel_rate: str = "5",
+    secondary_aspirate: bool = False,
+    secondary_x: int = 0,
+    secondary_y: int = 0,
+    secondary_z: Optional[int] = None,
+  ) -> bytes:
+    """Validate parameters and build the framed aspirate command.
+
+    See :meth:`manifold_aspirate` for the parameter documentation.
+    """
+    aspirate_z_default = get_plate_type_wash_defaults(plate_type)["aspirate_z"]
+    if aspirate_z is None:
+      aspirate_z = aspirate_z_default
+    if secondary_z is None:
+      secondary_z = aspirate_z_default
+
+    _validate_aspirate_offsets(aspirate_x, aspirate_y, aspirate_z)
+    _validate_aspirate_mode_params(travel_rate, delay)
+    if secondary_aspirate:
+      _validate_aspirate_offsets(secondary_x, secondary_y, secondary_z)
+
+    data = self._build_aspirate_command(
+      plate_type,
+      travel_rate,
+      aspirate_z,
+      aspirate_x,
+      aspirate_y,
+      int(delay * 1000 + 0.5),
+      secondary_aspirate,
+      secondary_x,
+      secondary_y,
+      secondary_z,
+    )
+    framed_command = build_framed_message_with_header(_ASPIRATE_HEADER, data)
+
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+        "Manifold aspirate: z=%d x=%d y=%d delay=%.3fs rate=%s secondary=%s",
+        aspirate_z,
+        aspirate_x,
+        aspirate_y,
+        delay,
+        travel_rate,
+        secondary_aspirate,
+      )
+
+    return framed_command
+
+  async def manifold_aspirate(
+    self,
+    plate_type: EL406PlateType,
+    aspirate_z: Optional[int] = None,
+    aspirate_x: int = 0,
+    aspirate_y: int = 0,
+    delay: float = 0.0,
+    travel_rate: str = "5",
+    secondary_aspirate: bool = False,
+    secondary_x: int = 0,
+    secondary_y: int = 0,
+    secondary_z: Optional[int] = None,
+  ) -> None:
+    """Aspirate the plate with the wash manifold.
+
+    Args:
+      plate_type: The plate type on the carrier.
+      aspirate_z: Aspirate height in 0.1 mm units. Defaults to the plate type default.
+      aspirate_x: Aspirate X offset, -60 to 60.
+      aspirate_y: Aspirate Y offset, -40 to 40.
+      delay: Delay at the aspirate position, in seconds (0-65.535).
+      travel_rate: Carrier travel rate in mm/s, one of "1" through "10".
+      secondary_aspirate: Whether to perform a secondary aspirate.
+      secondary_x: Secondary aspirate X offset.
+      secondary_y: Secondary aspirate Y offset.
+      secondary_z: Secondary aspirate height. Defaults to the plate type default.
+    """
+    framed_command = self._prepare_aspirate_step(
+      plate_type,
+      aspirate_z,
+      aspirate_x,
+      aspirate_y,
+      delay,
+      travel_rate,
+      secondary_aspirate,
+      secondary_x,
+      secondary_y,
+      secondary_z,
+    )
+    await self._run_step(plate_type, framed_command)
+
+  def prepare_manifold_aspirate(
+    self, plate_type: EL406PlateType, **kwargs
+  ) -> Callable[[], Awaitable[None]]:
+    """Build an aspirate command once and return a coroutine function that sends it.
+
+    Accepts the same keyword arguments as :meth:`manifold_aspirate`.
+    """
+    framed_command = self._prepare_aspirate_step(plate_type, **kwargs)
+
+    async def _run() -> None:
+      await self._run_step(plate_type, framed_command)
+
+    return _run
+
+  def _prepare_dispense_step(
+    self,
+    plate_type: EL406PlateType,
+    buffer: str = "A",
+    volume: Optional[int] = None,
+    flow_rate: int = 7,
+    dispense_x: int = 0,
+    dispense_y: int = 0,
+    dispense_z: Optional[int] = None,
+    pre_dispense_volume: int = 0,
+  ) -> bytes:
+    """Validate parameters and build the framed dispense command.
+
+    See :meth:`manifold_dispense` for the parameter documentation.
+    """
+    pt_defaults = get_plate_type_wash_defaults(plate_type)
+    if volume is None:
+      volume = pt_defaults["dispense_volume"]
+    if dispense_z is None:
+      dispense_z = pt_defaults["dispense_z"]
+
+    _validate_dispense_params(
+      buffer, volume, flow_rate, dispense_x, dispense_y, dispense_z, pre_dispense_volume
+    )
+
+    data = self._build_dispense_command(
+      plate_type, buffer, volume, flow_rate, dispense_x, dispense_y, dispense_z, pre_dispense_volume
+    )
+    framed_command = build_framed_message_with_header(_DISPENSE_HEADER, data)
+
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+        "Manifold dispense: buffer %s, %d uL at rate %d (z=%d x=%d y=%d)",
+        buffer,
+        volume,
+        flow_rate,
+        dispense_z,
+        dispense_x,
+        dispense_y,
+      )
+
+    return framed_command
+
+  async def manifold_dispense(
+    self,
+    plate_type: EL406PlateType,
+    buffer: str = "A",
+    volume: Optional[int] = None,
+    flow_rate: int = 7,
+    dispense_x: int = 0,
+    dispense_y: int = 0,
+    dispense_z: Optional[int] = None,
+    pre_dispense_volume: int = 0,
+  ) -> None:
+    """Dispense buffer into the plate with the wash manifold.
+
+    Args:
+      plate_type: The plate type on the carrier.
+      buffer: The buffer to dispense, "A" through "D".
+      volume: Dispense volume per well in uL (25-3000). Defaults to the plate type default.
+      flow_rate: Dispense flow rate, 1-9.
+      dispense_x: Dispense X offset, -60 to 60.
+      dispense_y: Dispense Y offset, -40 to 40.
+      dispense_z: Dispense height in 0.1 mm units. Defaults to the plate type default.
+      pre_dispense_volume: Volume to pre-dispense to waste before the plate, in uL.
+    """
+    framed_command = self._prepare_dispense_step(
+      plate_type,
+      buffer,
+      volume,
+      flow_rate,
+      dispense_x,
+      dispense_y,
+      dispense_z,
+      pre_dispense_volume,
+    )
+    await self._run_step(plate_type, framed_command)
+
+  def prepare_manifold_dispense(
+    self, plate_type: EL406PlateType, **kwargs
+  ) -> Callable[[], Awaitable[None]]:
+    """Build a dispense command once and return a coroutine function that sends it.
+
+    Accepts the same keyword arguments as :meth:`manifold_dispense`.
+    """
+    framed_command = self._prepare_dispense_step(plate_type, **kwargs)
+
+    async def _run() -> None:
+      await self._run_step(plate_type, framed_command)
+
+    return _run
+
+  def _prepare_wash_step(
+    self,
+    plate_type: EL406PlateType,
+    cycles: int = 1,
+    buffer: str = "A",
+    dispense_volume: Optional[int] = None,
+    dispense_z: Optional[int] = None,
+    dispense_flow_rate: int = 7,
+    dispense_x: int = 0,
+    dispense_y: int = 0,
+    aspirate_z: Optional[int] = None,
+    aspirate_x: int = 0,
+    aspirate_y: int = 0,
+    aspirate_delay: float = 0.0,
+    aspirate_travel_rate: str = "5",
+    secondary_aspirate: bool = False,
+    secondary_z: Optional[int] = None,
+    secondary_delay: float = 0.0,
+    secondary_travel_rate: str = "5",
+    final_aspirate: bool = True,
+    final_secondary_z: Optional[int] = None,
+    final_aspirate_delay: float = 0.0,
+    final_travel_rate: str = "5",
+    bottom_wash: bool = False,
+    bottom_wash_volume: int = 0,
+    pre_dispense_volume: int = 0,
+    mid_cycle_volume: int = 0,
+    low_flow_volume: int = 0,
+    vacuum_filtration: bool = False,
+    vacuum_time: float = 0.0,
+    vacuum_delay: float = 0.0,
+    wash_format: str = "Plate",
+    sectors: Optional[List[int]] = None,
+    shake_duration: int = 0,
+    shake_intensity: str = "Medium",
+    soak_duration: int = 0,
+  ) -> Tuple[bytes, int]:
+    """Validate parameters and build the framed wash command.
+
+    See :meth:`manifold_wash` for the parameter documentation.
+
+    Returns:
+      The framed command bytes and the acknowledgement timeout in seconds.
+    """
+    resolved = _validate_wash_params(
+      plate_type,
+      cycles,
+      buffer,
+      dispense_volume,
+      dispense_z,
+      dispense_flow_rate,
+      dispense_x,
+      dispense_y,
+      aspirate_z,
+      aspirate_x,
+      aspirate_y,
+      aspirate_delay,
+      aspirate_travel_rate,
+      secondary_aspirate,
+      secondary_z,
+      secondary_delay,
+      secondary_travel_rate,
+      final_aspirate,
+      final_secondary_z,
+      final_aspirate_delay,
+      final_travel_rate,
+      bottom_wash,
+      bottom_wash_volume,
+      pre_dispense_volume,
+      mid_cycle_volume,
+      low_flow_volume,
+      vacuum_filtration,
+      vacuum_time,
+      vacuum_delay,
+      shake_duration,
+      shake_intensity,
+      soak_duration,
+    )
+    dispense_volume, dispense_z, aspirate_z, secondary_z, final_secondary_z = resolved
+
+    if wash_format not in ("Plate", "Sector"):
+      raise ValueError(_ERR_WASH_FORMAT.format(wash_format))
+    if sectors is None:
+      sector_mask = 0x0F
+    else:
+      sector_mask = 0
+      for q in sectors:
+        # the lower bound is checked per sector so a non-positive sector raises the prepared
+        # message instead of a bare shift error
+        if q < 1:
+          raise ValueError(_ERR_SECTORS.format(sectors))
+        sector_mask |= 1 << (q - 1)
+      # a single post-loop test against the complement covers the upper bound: any sector
+      # above 4 sets a bit outside the low nibble
+      if sector_mask & ~0x0F or not sectors:
+        raise ValueError(_ERR_SECTORS.format(sectors))
+
+    data = self._build_wash_composite_command(
+      plate_type,
+      cycles,
+      buffer,
+      dispense_volume,
+      dispense_z,
+      dispense_flow_rate,
+      dispense_x,
+      dispense_y,
+      aspirate_z,
+      aspirate_x,
+      aspirate_y,
+      aspirate_delay,
+      aspirate_travel_rate,
+      secondary_aspirate,
+      secondary_z,
+      secondary_delay,
+      secondary_travel_rate,
+      final_aspirate,
+      final_secondary_z,
+      final_aspirate_delay,
+      final_travel_rate,
+      bottom_wash,
+      bottom_wash_volume,
+      pre_dispense_volume,
+      mid_cycle_volume,
+      low_flow_volume,
+      vacuum_filtration,
+      vacuum_time,
+      vacuum_delay,
+      wash_format,
+      sector_mask,
+      shake_duration,
+      shake_intensity,
+      soak_duration,
+    )
+    framed_command = build_framed_message_with_header(_WASH_HEADER, data)
+
+    wash_timeout = (
+      _WASH_TIMEOUT_BASE + cycles * _WASH_TIMEOUT_PER_CYCLE + shake_duration + soak_duration
+    )
+
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+        "Manifold wash: %d cycle(s) of buffer %s, dispense %d uL at rate %d (z=%d x=%d y=%d), "
+        "aspirate (z=%d x=%d y=%d delay=%.3fs rate=%s), secondary=%s (z=%d delay=%.3fs rate=%s), "
+        "final=%s (z=%d delay=%.3fs rate=%s), bottom_wash=%s, vacuum=%s, format=%s mask=0x%02X, "
+        "shake=%ds soak=%ds",
+        cycles,
+        buffer,
+        dispense_volume,
+        dispense_flow_rate,
+        dispense_z,
+        dispense_x,
+        dispense_y,
+        aspirate_z,
+        aspirate_x,
+        aspirate_y,
+        aspirate_delay,
+        aspirate_travel_rate,
+        secondary_aspirate,
+        secondary_z,
+        secondary_delay,
+        secondary_travel_rate,
+        final_aspirate,
+        final_secondary_z,
+        final_aspirate_delay,
+        final_travel_rate,
+        bottom_wash,
+        vacuum_filtration,
+        wash_format,
+        sector_mask,
+        shake_duration,
+        soak_duration,
+      )
+
+    return framed_command, wash_timeout
+
+  async def manifold_wash(
+    self,
+    plate_type: EL406PlateType,
+    cycles: int = 1,
+    buffer: str = "A",
+    dispense_volume: Optional[int] = None,
+    dispense_z: Optional[int] = None,
+    dispense_flow_rate: int = 7,
+    dispense_x: int = 0,
+    dispense_y: int = 0,
+    aspirate_z: Optional[int] = None,
+    aspirate_x: int = 0,
+    aspirate_y: int = 0,
+    aspirate_delay: float = 0.0,
+    aspirate_travel_rate: str = "5",
+    secondary_aspirate: bool = False,
+    secondary_z: Optional[int] = None,
+    secondary_delay: float = 0.0,
+    secondary_travel_rate: str = "5",
+    final_aspirate: bool = True,
+    final_secondary_z: Optional[int] = None,
+    final_aspirate_delay: float = 0.0,
+    final_travel_rate: str = "5",
+    bottom_wash: bool = False,
+    bottom_wash_volume: int = 0,
+    pre_dispense_volume: int = 0,
+    mid_cycle_volume: int = 0,
+    low_flow_volume: int = 0,
+    vacuum_filtration: bool = False,
+    vacuum_time: float = 0.0,
+    vacuum_delay: float = 0.0,
+    wash_format: str = "Plate",
+    sectors: Optional[List[int]] = None,
+    shake_duration: int = 0,
+    shake_intensity: str = "Medium",
+    soak_duration: int = 0,
+  ) -> None:
+    """Run a composite wash (dispense + aspirate cycles) with the wash manifold.
+
+    Args:
+      plate_type: The plate type on the carrier.
+      cycles: Number of wash cycles, 1-10.
+      buffer: The buffer to wash with, "A" through "D".
+      dispense_volume: Dispense volume per well in uL. Defaults to the plate type default.
+      dispense_z: Dispense height. Defaults to the plate type default.
+      dispense_flow_rate: Dispense flow rate, 1-9.
+      dispense_x: Dispense X offset, -60 to 60.
+      dispense_y: Dispense Y offset, -40 to 40.
+      aspirate_z: Aspirate height. Defaults to the plate type default.
+      aspirate_x: Aspirate X offset, -60 to 60.
+      aspirate_y: Aspirate Y offset, -40 to 40.
+      aspirate_delay: Delay at the aspirate position per cycle, in seconds.
+      aspirate_travel_rate: Carrier travel rate during aspirate, "1" through "10".
+      secondary_aspirate: Whether to perform a secondary aspirate each cycle.
+      secondary_z: Secondary aspirate height. Defaults to the plate type default.
+      secondary_delay: Secondary aspirate delay, in seconds.
+      secondary_travel_rate: Secondary aspirate travel rate.
+      final_aspirate: Whether to perform a final aspirate after the last cycle.
+      final_secondary_z: Final aspirate height. Defaults to the plate type default.
+      final_aspirate_delay: Final aspirate delay, in seconds.
+      final_travel_rate: Final aspirate travel rate.
+      bottom_wash: Whether to perform a bottom wash.
+      bottom_wash_volume: Bottom wash volume in uL; 0 uses the dispense volume.
+      pre_dispense_volume: Volume to pre-dispense to waste, in uL.
+      mid_cycle_volume: Mid-cycle dispense volume in uL.
+      low_flow_volume: Low-flow dispense volume in uL.
+      vacuum_filtration: Whether to use vacuum filtration.
+      vacuum_time: Vacuum time in seconds, 5-999.
+      vacuum_delay: Vacuum delay in seconds.
+      wash_format: "Plate" to wash the full plate, "Sector" to wash sectors.
+      sectors: Sectors (quadrants) to wash, each 1-4. ``None`` washes all sectors.
+      shake_duration: Shake duration between cycles, in seconds.
+      shake_intensity: Shake intensity, one of "Variable", "Slow", "Medium", "Fast".
+      soak_duration: Soak duration between cycles, in seconds.
+    """
+    framed_command, wash_timeout = self._prepare_wash_step(
+      plate_type,
+      cycles,
+      buffer,
+      dispense_volume,
+      dispense_z,
+      dispense_flow_rate,
+      dispense_x,
+      dispense_y,
+      aspirate_z,
+      aspirate_x,
+      aspirate_y,
+      aspirate_delay,
+      aspirate_travel_rate,
+      secondary_aspirate,
+      secondary_z,
+      secondary_delay,
+      secondary_travel_rate,
+      final_aspirate,
+      final_secondary_z,
+      final_aspirate_delay,
+      final_travel_rate,
+      bottom_wash,
+      bottom_wash_volume,
+      pre_dispense_volume,
+      mid_cycle_volume,
+      low_flow_volume,
+      vacuum_filtration,
+      vacuum_time,
+      vacuum_delay,
+      wash_format,
+      sectors,
+      shake_duration,
+      shake_intensity,
+      soak_duration,
+    )
+    await self._run_step(plate_type, framed_command, timeout=wash_timeout)
+
+  def prepare_manifold_wash(
+    self, plate_type: EL406PlateType, **kwargs
+  ) -> Callable[[], Awaitable[None]]:
+    """Build a wash command once and return a coroutine function that sends it.
+
+    Accepts the same keyword arguments as :meth:`manifold_wash`. When the same wash runs many
+    times, this amortizes validation and the 102-byte payload build over all runs; each call of
+    the returned function only sends the prebuilt frame.
+    """
+    framed_command, wash_timeout = self._prepare_wash_step(plate_type, **kwargs)
+
+    async def _run() -> None:
+      await self._run_step(plate_type, framed_command, timeout=wash_timeout)
+
+    return _run
+
+  def build_wash_batch(self, steps: Sequence[Dict[str, Any]]) -> List[Tuple[bytes, int]]:
+    """Build the framed commands for a sequence of wash steps up front.
+
+    Each entry holds :meth:`manifold_wash` keyword arguments, including ``plate_type``. Steps
+    that share a configuration reuse the same cached payload template, so the per-step cost is
+    one validation pass and one template patch — no per-step builder allocations.
+
+    Returns:
+      One ``(framed command, acknowledgement timeout)`` pair per step, in order, ready to be
+      sent e.g. under :meth:`batch`.
+    """
+    prepare_wash_step = self._prepare_wash_step
+    return [prepare_wash_step(**step) for step in steps]
+
+  async def manifold_wash_many(self, plate_types: List[EL406PlateType], **kwargs) -> None:
+    """Run the same wash on a sequence of plates.
+
+    Accepts the same keyword arguments as :meth:`manifold_wash`, shared by every plate.
+    Validation and the payload build run once per distinct plate type instead of once per
+    plate.
+    """
+    # bound once outside the loop; each self.X in the loop body would redo the descriptor walk
+    prepare_wash_step = self._prepare_wash_step
+    run_step = self._run_step
+    prepared: Dict[EL406PlateType, Tuple[bytes, int]] = {}
+    for plate_type in plate_types:
+      cached = prepared.get(plate_type)
+      if cached is None:
+        cached = prepare_wash_step(plate_type, **kwargs)
+        prepared[plate_type] = cached
+      framed_command, wash_timeout = cached
+      await run_step(plate_type, framed_command, timeout=wash_timeout)
+
+  async def manifold_prime(
+    self,
+    plate_type: EL406PlateType,
+    buffer: str = "A",
+    volume: int = 100,
+    flow_rate: int = 7,
+    duration: int = 0,
+    validate: bool = True,
+  ) -> None:
+    """Prime the wash manifold tubing with buffer.
+
+    Args:
+      plate_type: The plate type on the carrier.
+      buffer: The buffer to prime with, "A" through "D".
+      volume: Prime volume in uL, 10-3000.
+      flow_rate: Prime flow rate, 1-9.
+      duration: Prime duration in seconds; 0 primes by volume only.
+      validate: Whether to validate the parameters. Callers dispatching many commands from
+        already-validated configuration can pass ``False`` to skip the checks.
+    """
+    if validate:
+      validate_buffer(buffer)
+      if not 10 <= volume <= 3000:
+        raise ValueError(_ERR_PRIME_VOLUME.format(volume))
+      if not 1 <= flow_rate <= 9:
+        raise ValueError(_ERR_PRIME_FLOW_RATE.format(flow_rate))
+      if not 0 <= duration <= 600:
+        raise ValueError(_ERR_PRIME_DURATION.format(duration))
+
+    data = self._build_manifold_prime_command(plate_type, buffer, volume, flow_rate, duration)
+    framed_command = self._build_framed_message(EL406StepType.MANIFOLD_PRIME.value, data)
+
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+        "Manifold prime: buffer %s, %d uL at rate %d (%s)",
+        buffer,
+        volume,
+        flow_rate,
+        "timed" if duration > 0 else "volume",
+      )
+
+    await self._run_step(plate_type, framed_command, timeout=duration + 30)
+
+  async def manifold_auto_clean(
+    self,
+    plate_type: EL406PlateType,
+    buffer: str = "A",
+    duration_min: int = 5,
+    validate: bool = True,
+  ) -> None:
+    """Run the manifold auto-clean routine.
+
+    Args:
+      plate_type: The plate type on the carrier.
+      buffer: The buffer to clean with, "A" through "D".
+      duration_min: Clean duration in minutes, 1-60.
+      validate: Whether to validate the parameters. Callers dispatching many commands from
+        already-validated configuration can pass ``False`` to skip the checks.
+    """
+    if validate:
+      validate_buffer(buffer)
+      if not 1 <= duration_min <= 60:
+        raise ValueError(_ERR_AUTO_CLEAN_DURATION.format(duration_min))
+
+    data = self._build_auto_clean_command(plate_type, buffer, duration_min)
+    framed_command = self._build_framed_message(EL406StepType.MANIFOLD_AUTO_CLEAN.value, data)
+
+    if logger.isEnabledFor(logging.INFO):
+      logger.info("Manifold auto-clean: buffer %s for %d minute(s)", buffer, duration_min)
+
+    await self._run_step(plate_type, framed_command, timeout=duration_min * 60 + 30)
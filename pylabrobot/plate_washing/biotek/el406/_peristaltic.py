@@ -0,0 +1,393 @@
+"""Peristaltic pump step commands for the BioTek EL406."""
+
+import functools
+import logging
+import struct
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pylabrobot.plate_washing.biotek.el406._base import EL406StepsBaseMixin
+from pylabrobot.plate_washing.biotek.el406.enums import EL406PlateType, EL406StepType
+from pylabrobot.plate_washing.biotek.el406.helpers import encode_column_mask, plate_type_well_count
+from pylabrobot.plate_washing.biotek.el406.protocol import scratch_writer
+
+logger = logging.getLogger(__name__)
+
+PERISTALTIC_FLOW_RATE_MAP: Dict[str, int] = {"Low": 0x00, "Medium": 0x01, "High": 0x02}
+
+
+# Wire byte per cassette name, built once with the common casings pre-resolved so the hot path
+# is a single dict probe with no .upper() call (mirroring _BUFFER_BYTE in _manifold).
+_CASSETTE_TO_BYTE: Dict[str, int] = {"ANY": 0x00, "1UL": 0x01, "5UL": 0x02, "10UL": 0x03}
+for _name in ("Any", "any", "1uL", "1ul", "5uL", "5ul", "10uL", "10ul"):
+  _CASSETTE_TO_BYTE[_name] = _CASSETTE_TO_BYTE[_name.upper()]
+del _name
+
+
+def cassette_to_byte(cassette: str) -> int:
+  """Convert a peristaltic cassette name to the byte sent to the firmware."""
+  try:
+    return _CASSETTE_TO_BYTE[cassette]
+  except KeyError:
+    # unusual casings (e.g. "aNy") still resolve, via one .upper() on this cold path
+    byte = _CASSETTE_TO_BYTE.get(cassette.upper())
+    if byte is None:
+      raise ValueError(
+        f'Cassette must be one of "Any", "1uL", "5uL", "10uL", got {cassette!r}'
+      ) from None
+    return byte
+
+
+# Membership set and error template built once; the sort only ever ran for the message, and
+# doing it per call put it on the hot path.
+_VALID_FLOW_RATES = frozenset(PERISTALTIC_FLOW_RATE_MAP)
+_FLOW_RATE_ERROR = "flow_rate must be one of {}, got {{!r}}".format(
+  sorted(PERISTALTIC_FLOW_RATE_MAP)
+)
+
+
+def validate_peristaltic_flow_rate(flow_rate: str) -> None:
+  """Validate a peristaltic flow rate name."""
+  if flow_rate not in _VALID_FLOW_RATES:
+    raise ValueError(_FLOW_RATE_ERROR.format(flow_rate))
+
+
+def encode_quadrant_mask_inverted(rows: Optional[Sequence[int]], num_row_groups: int = 8) -> int:
+  """Encode a list of 1-based row groups into an inverted bitmask.
+
+  A set bit excludes the corresponding row group. ``None`` excludes nothing.
+  """
+  if rows is None:
+    return 0x00
+  max_mask = (1 << num_row_groups) - 1
+  bits = 0
+  for row in rows:
+    # the lower bound is checked per row so a non-positive row group raises the prepared
+    # message instead of a bare shift error, mirroring the sector check in _manifold
+    if row < 1:
+      raise ValueError(f"Row groups must be 1-{num_row_groups}, got {list(rows)}")
+    bits |= 1 << (row - 1)
+  # a single post-loop test covers the upper bound: any row above the group count sets a bit
+  # outside max_mask. Inverting once with XOR replaces the per-row AND-NOT sequence.
+  if bits & ~max_mask:
+    raise ValueError(f"Row groups must be 1-{num_row_groups}, got {list(rows)}")
+  return (max_mask ^ bits) & 0xFF
+
+
+# Protocols reuse the same well selection across hundreds of dispenses, so the mask encodings
+# are cached on their (selection tuple, geometry) key; both encoders accept tuples directly.
+@functools.lru_cache(maxsize=128)
+def _cached_column_mask(columns: Optional[Tuple[int, ...]], plate_wells: int) -> bytes:
+  return encode_column_mask(columns, plate_wells=plate_wells)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_quadrant_mask(rows: Optional[Tuple[int, ...]], num_row_groups: int = 8) -> int:
+  return encode_quadrant_mask_inverted(rows, num_row_groups)
+
+
+# Pre-compiled layouts for the fixed-size step payloads: one C-level pack call per build
+# replaces the per-field Writer method dispatches. "x" fields are the reserved (zero) regions;
+# "6s" is the precomputed column mask blob.
+_PRIME_STRUCT = struct.Struct("<BHHBBBB2x")
+_DISPENSE_STRUCT = struct.Struct("<BHBBbbHHB6sB4x")
+assert _PRIME_STRUCT.size == 11
+assert _DISPENSE_STRUCT.size == 23
+
+# Reserved (zero) payload region, named once at module scope.
+_PAD4 = b"\x00" * 4
+
+_U16 = struct.Struct("<H")
+
+# Builders specialized per dispense configuration, keyed on the fields that rarely change
+# between the dispenses of one protocol (everything except volume and z); mirrors
+# _WASH_BUILDER_CACHE in _manifold.
+# keys mix the static int fields with the precomputed bytes column mask
+_DISPENSE_BUILDER_CACHE: Dict[Tuple[Any, ...], Callable[[int, int], bytes]] = {}
+
+
+def _dispense_builder(
+  plate_value: int,
+  flow_rate_byte: int,
+  cassette_byte: int,
+  offset_x: int,
+  offset_y: int,
+  pre_dispense_volume: int,
+  num_pre_dispenses: int,
+  column_mask: bytes,
+  row_mask: int,
+) -> Callable[[int, int], bytes]:
+  """Return a dispense payload builder specialized for one configuration.
+
+  Protocols typically fix the plate, flow rate, cassette, offsets and well selection and vary
+  only the volume (and sometimes z) between dispenses. Those static fields are baked into a
+  23-byte template once per configuration; each build copies the template and patches just the
+  volume and z fields.
+  """
+  key = (
+    plate_value,
+    flow_rate_byte,
+    cassette_byte,
+    offset_x,
+    offset_y,
+    pre_dispense_volume,
+    num_pre_dispenses,
+    column_mask,
+    row_mask,
+  )
+  builder = _DISPENSE_BUILDER_CACHE.get(key)
+  if builder is None:
+    # volume and z zeroed; they are overwritten on every build
+    template = _DISPENSE_STRUCT.pack(
+      plate_value,
+      0,
+      flow_rate_byte,
+      cassette_byte,
+      offset_x,
+      offset_y,
+      0,
+      pre_dispense_volume,
+      num_pre_dispenses,
+      column_mask,
+      row_mask,
+    )
+    pack_into = _U16.pack_into
+
+    def builder(volume: int, offset_z: int) -> bytes:
+      buf = bytearray(template)
+      pack_into(buf, 1, volume)
+      pack_into(buf, 7, offset_z)
+      return bytes(buf)
+
+    _DISPENSE_BUILDER_CACHE[key] = builder
+  return builder
+
+
+class EL406PeristalticStepsMixin(EL406StepsBaseMixin):
+  """Peristaltic pump prime, dispense and purge steps."""
+
+  __slots__ = ()
+
+  def _validate_peristaltic_well_selection(
+    self,
+    plate_type: EL406PlateType,
+    columns: Optional[List[int]],
+    rows: Optional[List[int]],
+  ) -> Tuple[Optional[Tuple[int, ...]], Optional[Tuple[int, ...]]]:
+    """Validate column/row selections against the plate geometry.
+
+    Returns the selections in tuple form so they can key the cached mask encoders.
+    """
+    if columns is not None and len(columns) == 0:
+      raise ValueError("Column selection must not be empty")
+    if rows is not None and len(rows) == 0:
+      raise ValueError("Row selection must not be empty")
+    # column bounds are checked by encode_column_mask against the plate geometry
+    return (
+      tuple(columns) if columns is not None else None,
+      tuple(rows) if rows is not None else None,
+    )
+
+  def _build_peristaltic_prime_command(
+    self,
+    plate_type: EL406PlateType,
+    volume: int,
+    duration: int,
+    flow_rate: str,
+    cassette: str,
+    pump: int,
+  ) -> bytes:
+    """Build the 11-byte peristaltic prime payload.
+
+    Layout (little endian): plate type, volume uL (u16), duration s (u16), flow rate, cassette,
+    pump, cycles, 2 reserved bytes.
+    """
+    return _PRIME_STRUCT.pack(
+      plate_type.value,
+      int(volume),
+      duration,
+      PERISTALTIC_FLOW_RATE_MAP[flow_rate],
+      cassette_to_byte(cassette),
+      pump,
+      0x01,
+    )
+
+  def _build_peristaltic_dispense_command(
+    self,
+    plate_type: EL406PlateType,
+    volume: int,
+    flow_rate: str,
+    cassette: str,
+    offset_x: int,
+    offset_y: int,
+    offset_z: int,
+    pre_dispense_volume: int,
+    num_pre_dispenses: int,
+    columns: Optional[Tuple[int, ...]],
+    rows: Optional[Tuple[int, ...]],
+  ) -> bytes:
+    """Build the 23-byte peristaltic dispense payload.
+
+    Layout (little endian): plate type, volume uL (u16), flow rate, cassette, x (i8), y (i8),
+    z (u16), pre-dispense volume uL (u16), number of pre-dispenses, column mask (6 bytes),
+    inverted quadrant mask, 4 reserved bytes.
+    """
+    builder = _dispense_builder(
+      plate_type.value,
+      PERISTALTIC_FLOW_RATE_MAP[flow_rate],
+      cassette_to_byte(cassette),
+      offset_x,
+      offset_y,
+      int(pre_dispense_volume),
+      num_pre_dispenses,
+      _cached_column_mask(columns, plate_type_well_count(plate_type)),
+      _cached_quadrant_mask(rows),
+    )
+    return builder(int(volume), offset_z)
+
+  async def peristaltic_prime(
+    self,
+    plate_type: EL406PlateType,
+    volume: int = 500,
+    duration: int = 0,
+    flow_rate: str = "High",
+    cassette: str = "Any",
+    pump: int = 1,
+  ) -> None:
+    """Prime the peristaltic pump tubing.
+
+    Args:
+      plate_type: The plate type on the carrier.
+      volume: Prime volume in uL, 10-3000.
+      duration: Prime duration in seconds; 0 primes by volume only.
+      flow_rate: Flow rate, one of "Low", "Medium", "High".
+      cassette: Cassette type, one of "Any", "1uL", "5uL", "10uL".
+      pump: The pump to prime, 1 or 2.
+    """
+    if not 10 <= volume <= 3000:
+      raise ValueError(f"Prime volume must be 10-3000 uL, got {volume}")
+    if not 0 <= duration <= 600:
+      raise ValueError(f"Prime duration must be 0-600 seconds, got {duration}")
+    validate_peristaltic_flow_rate(flow_rate)
+    if pump not in (1, 2):
+      raise ValueError(f"Pump must be 1 or 2, got {pump}")
+
+    data = self._build_peristaltic_prime_command(
+      plate_type, volume, duration, flow_rate, cassette, pump
+    )
+    framed_command = self._build_framed_message(EL406StepType.PERISTALTIC_PRIME.value, data)
+
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+        "Peristaltic prime: %d uL at %s flow on pump %d (cassette %s)",
+        volume,
+        flow_rate,
+        pump,
+        cassette,
+      )
+
+    await self._run_step(plate_type, framed_command, timeout=duration + 30)
+
+  async def peristaltic_dispense(
+    self,
+    plate_type: EL406PlateType,
+    volume: float,
+    flow_rate: str = "High",
+    cassette: str = "Any",
+    offset_x: int = 0,
+    offset_y: int = 0,
+    offset_z: int = 30,
+    pre_dispense_volume: int = 0,
+    num_pre_dispenses: int = 2,
+    columns: Optional[List[int]] = None,
+    rows: Optional[List[int]] = None,
+  ) -> None:
+    """Dispense with the peristaltic pump.
+
+    Args:
+      plate_type: The plate type on the carrier.
+      volume: Dispense volume per well in uL, 1-3000.
+      flow_rate: Flow rate, one of "Low", "Medium", "High".
+      cassette: Cassette type, one of "Any", "1uL", "5uL", "10uL".
+      offset_x: Dispense X offset, -60 to 60.
+      offset_y: Dispense Y offset, -40 to 40.
+      offset_z: Dispense height in 0.1 mm units, 1-210.
+      pre_dispense_volume: Volume to pre-dispense to waste, in uL.
+      num_pre_dispenses: Number of pre-dispenses, 0-10.
+      columns: Columns to dispense into, 1-based. ``None`` dispenses into all columns.
+      rows: Row groups to dispense into, 1-based. ``None`` dispenses into all rows.
+    """
+    if not 1 <= volume <= 3000:
+      raise ValueError(f"Dispense volume must be 1-3000 uL, got {volume}")
+    validate_peristaltic_flow_rate(flow_rate)
+    if not -60 <= offset_x <= 60:
+      raise ValueError(f"Dispense X offset must be -60-60, got {offset_x}")
+    if not -40 <= offset_y <= 40:
+      raise ValueError(f"Dispense Y offset must be -40-40, got {offset_y}")
+    if not 1 <= offset_z <= 210:
+      raise ValueError(f"Dispense Z offset must be 1-210, got {offset_z}")
+    if not 0 <= pre_dispense_volume <= 3000:
+      raise ValueError(f"Pre-dispense volume must be 0-3000 uL, got {pre_dispense_volume}")
+    if not 0 <= num_pre_dispenses <= 10:
+      raise ValueError(f"Number of pre-dispenses must be 0-10, got {num_pre_dispenses}")
+    column_selection, row_selection = self._validate_peristaltic_well_selection(
+      plate_type, columns, rows
+    )
+
+    data = self._build_peristaltic_dispense_command(
+      plate_type,
+      int(volume),
+      flow_rate,
+      cassette,
+      offset_x,
+      offset_y,
+      offset_z,
+      pre_dispense_volume,
+      num_pre_dispenses,
+      column_selection,
+      row_selection,
+    )
+    framed_command = self._build_framed_message(EL406StepType.PERISTALTIC_DISPENSE.value, data)
+
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+        "Peristaltic dispense: %.1f uL at %s flow (cassette %s, z=%d x=%d y=%d)",
+        volume,
+        flow_rate,
+        cassette,
+        offset_z,
+        offset_x,
+        offset_y,
+      )
+
+    await self._run_step(plate_type, framed_command)
+
+  async def peristaltic_purge(
+    self,
+    plate_type: EL406PlateType,
+    duration: int = 10,
+    pump: int = 1,
+  ) -> None:
+    """Purge the peristaltic pump tubing back to the supply bottle.
+
+    Args:
+      plate_type: The plate type on the carrier.
+      duration: Purge duration in seconds, 1-600.
+      pump: The pump to purge, 1 or 2.
+    """
+    if not 1 <= duration <= 600:
+      raise ValueError(f"Purge duration must be 1-600 seconds, got {duration}")
+    if pump not in (1, 2):
+      raise ValueError(f"Pump must be 1 or 2, got {pump}")
+
+    w = scratch_writer()
+    w.u8(plate_type.value)
+    w.u16(duration)
+    w.u8(pump)
+    w.raw_bytes(_PAD4)
+    data = w.finish()
+    framed_command = self._build_framed_message(EL406StepType.PERISTALTIC_PURGE.value, data)
+
+    if logger.isEnabledFor(logging.INFO):
+      logger.info("Peristaltic purge: %ds on pump %d", duration, pump)
+
+    await self._run_step(plate_type, framed_command, timeout=duration + 30)
@@ -0,0 +1,100 @@
+"""Shake step commands for the BioTek EL406."""
+
+import logging
+import struct
+from typing import Dict
+
+from pylabrobot.plate_washing.biotek.el406._base import EL406StepsBaseMixin
+from pylabrobot.plate_washing.biotek.el406.enums import EL406PlateType, EL406StepType
+
+logger = logging.getLogger(__name__)
+
+# Shake intensity names to the intensity byte sent to the firmware.
+INTENSITY_TO_BYTE: Dict[str, int] = {
+  "Variable": 0x00,
+  "Slow": 0x01,
+  "Medium": 0x02,
+  "Fast": 0x03,
+}
+
+
+# Pre-compiled layout for the 12-byte shake payload: one C-level pack call per build replaces
+# the per-field Writer method dispatches. "x" fields are the reserved (zero) regions.
+_SHAKE_STRUCT = struct.Struct("<BBHBBH4x")
+assert _SHAKE_STRUCT.size == 12
+
+# Slot-indexed companion tables, mirroring the travel rate tables in _manifold.
+_INTENSITY_INDEX = {intensity: i for i, intensity in enumerate(INTENSITY_TO_BYTE)}
+_INTENSITY_BYTES = tuple(INTENSITY_TO_BYTE.values())
+
+# Membership set and error template built once; sorting the names per call put the sort on the
+# hot path even though it only ever fed the error message.
+_VALID_INTENSITIES = frozenset(INTENSITY_TO_BYTE)
+_INTENSITY_ERROR = "Shake intensity must be one of {}, got {{!r}}".format(sorted(INTENSITY_TO_BYTE))
+
+
+def validate_intensity(intensity: str) -> None:
+  """Validate a shake intensity name."""
+  if intensity not in _VALID_INTENSITIES:
+    raise ValueError(_INTENSITY_ERROR.format(intensity))
+
+
+class EL406ShakeStepsMixin(EL406StepsBaseMixin):
+  """Shake and soak steps."""
+
+  __slots__ = ()
+
+  def _build_shake_command(
+    self,
+    plate_type: EL406PlateType,
+    shake_duration: int,
+    intensity: str,
+    soak_duration: int,
+  ) -> bytes:
+    """Build the 12-byte shake payload.
+
+    Layout (little endian): plate type, mode, shake duration s (u16), intensity, reserved,
+    soak duration s (u16), 4 reserved bytes.
+    """
+    return _SHAKE_STRUCT.pack(
+      plate_type.value,
+      0x00,
+      shake_duration,
+      _INTENSITY_BYTES[_INTENSITY_INDEX[intensity]],
+      0x00,
+      soak_duration,
+    )
+
+  async def shake(
+    self,
+    plate_type: EL406PlateType,
+    shake_duration: int = 10,
+    intensity: str = "Medium",
+    soak_duration: int = 0,
+  ) -> None:
+    """Shake the plate, optionally followed by a soak.
+
+    Args:
+      plate_type: The plate type on the carrier.
+      shake_duration: Shake duration in seconds, 1-600.
+      intensity: Shake intensity, one of "Variable", "Slow", "Medium", "Fast".
+      soak_duration: Soak duration in seconds, 0-600.
+    """
+    if not 1 <= shake_duration <= 600:
+      raise ValueError(f"Shake duration must be 1-600 seconds, got {shake_duration}")
+    validate_intensity(intensity)
+    if not 0 <= soak_duration <= 600:
+      raise ValueError(f"Soak duration must be 0-600 seconds, got {soak_duration}")
+
+    data = self._build_shake_command(plate_type, shake_duration, intensity, soak_duration)
+    framed_command = self._build_framed_message(EL406StepType.SHAKE.value, data)
+
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+        "Shake: %ds at %s intensity, soak %ds",
+        shake_duration,
+        intensity,
+        soak_duration,
+      )
+
+    await self._run_step(plate_type, framed_command, timeout=shake_duration + soak_duration + 30)
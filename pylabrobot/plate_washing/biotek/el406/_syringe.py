@@ -0,0 +1,434 @@
+"""Syringe pump step commands for the BioTek EL406."""
+
+import logging
+import struct
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pylabrobot.plate_washing.biotek.el406._base import EL406StepsBaseMixin
+from pylabrobot.plate_washing.biotek.el406.enums import EL406StepType
+from pylabrobot.plate_washing.biotek.el406.helpers import encode_column_mask
+from pylabrobot.plate_washing.biotek.el406.protocol import make_framer
+
+logger = logging.getLogger(__name__)
+
+
+# Wire byte per syringe selector, built once with the common casings pre-resolved so the hot
+# path is a single dict probe with no .upper() call (mirroring _CASSETTE_TO_BYTE in
+# _peristaltic).
+_SYRINGE_TO_BYTE: Dict[str, int] = {"A": 0x00, "B": 0x01, "BOTH": 0x02}
+for _name in ("a", "b", "Both", "both"):
+  _SYRINGE_TO_BYTE[_name] = _SYRINGE_TO_BYTE[_name.upper()]
+del _name
+
+
+def syringe_to_byte(syringe: str) -> int:
+  """Convert a syringe selector ("A", "B" or "Both") to the byte sent to the firmware."""
+  try:
+    return _SYRINGE_TO_BYTE[syringe]
+  except KeyError:
+    # unusual casings (e.g. "bOTH") still resolve, via one .upper() on this cold path
+    byte = _SYRINGE_TO_BYTE.get(syringe.upper())
+    if byte is None:
+      raise ValueError(f'Syringe must be one of "A", "B", "Both", got {syringe!r}') from None
+    return byte
+
+
+# Pre-compiled layouts for the fixed-size step payloads: one C-level pack call per build
+# replaces the per-byte list construction (and the manual low/high byte splits). "x" fields are
+# the reserved (zero) regions; "6s" is the precomputed column mask blob.
+_DISPENSE_STRUCT = struct.Struct("<BBHBbbHHHB6sB5x")
+_PRIME_STRUCT = struct.Struct("<BBHBBHBHBx")
+assert _DISPENSE_STRUCT.size == 26
+assert _PRIME_STRUCT.size == 13
+
+# Framers specialized per opcode: the frame prefix and the constant checksum term are baked in
+# at import, so framing a payload is one closure call.
+_FRAME_DISPENSE = make_framer(EL406StepType.SYRINGE_DISPENSE.value, _DISPENSE_STRUCT.size)
+_FRAME_PRIME = make_framer(EL406StepType.SYRINGE_PRIME.value, _PRIME_STRUCT.size)
+
+# Bottle byte per syringe, indexed by the syringe byte (A=0, B=1, Both=2): reuses the selector
+# resolution the builders already do instead of a second dict probe on the uppercased name.
+_BOTTLE_DISPENSE = (0, 2, 4)
+_BOTTLE_PRIME = (0, 2)
+
+_U16 = struct.Struct("<H")
+
+# Per-configuration template builders, as for wash and peristaltic dispense commands: protocols
+# repeat dispenses with the same syringe, offsets, pre-dispense setup and column selection while
+# only the volume varies, so the full payload is packed once per configuration and reused with
+# the volume patched in. The resolved pre-dispense volume is part of the key, which also bakes
+# the pre_dispense on/off decision into the cached template.
+# keys mix the static int fields with the precomputed bytes column mask
+_DISPENSE_BUILDER_CACHE: Dict[Tuple[Any, ...], Callable[[int], bytes]] = {}
+
+
+def _dispense_builder(
+  plate_value: int,
+  syringe_byte: int,
+  flow_rate: int,
+  offset_x: int,
+  offset_y: int,
+  offset_z: int,
+  pump_delay_ms: int,
+  pre_dispense_volume: int,
+  num_pre_dispenses: int,
+  well_mask_bytes: bytes,
+) -> Callable[[int], bytes]:
+  """Return a builder that patches the volume into a prebuilt dispense payload."""
+  key = (
+    plate_value,
+    syringe_byte,
+    flow_rate,
+    offset_x,
+    offset_y,
+    offset_z,
+    pump_delay_ms,
+    pre_dispense_volume,
+    num_pre_dispenses,
+    well_mask_bytes,
+  )
+  builder = _DISPENSE_BUILDER_CACHE.get(key)
+  if builder is None:
+    template = _DISPENSE_STRUCT.pack(
+      plate_value,
+      syringe_byte,
+      0,  # volume, patched per build
+      flow_rate,
+      offset_x,
+      offset_y,
+      offset_z,
+      pump_delay_ms,
+      pre_dispense_volume,
+      num_pre_dispenses,
+      well_mask_bytes,
+      _BOTTLE_DISPENSE[syringe_byte],
+    )
+
+    def builder(volume: int) -> bytes:
+      buf = bytearray(template)
+      _U16.pack_into(buf, 2, volume)
+      return bytes(buf)
+
+    _DISPENSE_BUILDER_CACHE[key] = builder
+  return builder
+
+
+# Error templates built once at import; the successful path runs only the range check and the
+# failure path pays a single .format call, matching the validator style in _manifold.
+_ERR_SYRINGE = 'Syringe must be one of "A", "B", "Both", got {!r}'
+_ERR_VOLUME = "Syringe volume must be 5-3000 uL, got {}"
+_ERR_FLOW_RATE = "Syringe flow rate must be 1-5, got {}"
+_ERR_PUMP_DELAY = "Pump delay must be 0-5000 ms, got {}"
+_ERR_OFFSET_X = "Syringe X offset must be -128-127, got {}"
+_ERR_OFFSET_Y = "Syringe Y offset must be -128-127, got {}"
+_ERR_OFFSET_Z = "Syringe Z offset must be 0-210, got {}"
+_ERR_PRE_DISPENSE_VOLUME = "Pre-dispense volume must be 0-3000 uL, got {}"
+_ERR_NUM_PRE_DISPENSES = "Number of pre-dispenses must be 0-10, got {}"
+
+
+def validate_syringe(syringe: str) -> None:
+  if syringe.upper() not in ("A", "B", "BOTH"):
+    raise ValueError(_ERR_SYRINGE.format(syringe))
+
+
+def validate_syringe_volume(volume: float) -> None:
+  if not 5 <= volume <= 3000:
+    raise ValueError(_ERR_VOLUME.format(volume))
+
+
+def validate_syringe_flow_rate(flow_rate: int) -> None:
+  if not 1 <= flow_rate <= 5:
+    raise ValueError(_ERR_FLOW_RATE.format(flow_rate))
+
+
+def validate_pump_delay(pump_delay_ms: int) -> None:
+  if not 0 <= pump_delay_ms <= 5000:
+    raise ValueError(_ERR_PUMP_DELAY.format(pump_delay_ms))
+
+
+def validate_syringe_offsets(offset_x: int, offset_y: int, offset_z: int) -> None:
+  if not -128 <= offset_x <= 127:
+    raise ValueError(_ERR_OFFSET_X.format(offset_x))
+  if not -128 <= offset_y <= 127:
+    raise ValueError(_ERR_OFFSET_Y.format(offset_y))
+  if not 0 <= offset_z <= 210:
+    raise ValueError(_ERR_OFFSET_Z.format(offset_z))
+
+
+def validate_pre_dispense_volume(pre_dispense_volume: float) -> None:
+  if not 0 <= pre_dispense_volume <= 3000:
+    raise ValueError(_ERR_PRE_DISPENSE_VOLUME.format(pre_dispense_volume))
+
+
+def validate_num_pre_dispenses(num_pre_dispenses: int) -> None:
+  if not 0 <= num_pre_dispenses <= 10:
+    raise ValueError(_ERR_NUM_PRE_DISPENSES.format(num_pre_dispenses))
+
+
+# Selector spellings accepted without falling back to the .upper() slow path.
+_VALID_SYRINGES = frozenset(("A", "a", "B", "b", "Both", "BOTH", "both"))
+
+
+def _validate_syringe_dispense_args(
+  syringe: str,
+  volume: float,
+  flow_rate: int,
+  offset_x: int,
+  offset_y: int,
+  offset_z: int,
+  pump_delay_ms: int,
+  pre_dispense_volume: float,
+  num_pre_dispenses: int,
+) -> None:
+  """Slow-path validation for :meth:`syringe_dispense`.
+
+  Only entered when the combined fast-path check fails; runs the individual validators so the
+  error names the offending parameter. Returns normally for inputs the fast path merely did
+  not recognize (e.g. unusual selector casings).
+  """
+  validate_syringe(syringe)
+  validate_syringe_volume(volume)
+  validate_syringe_flow_rate(flow_rate)
+  validate_syringe_offsets(offset_x, offset_y, offset_z)
+  validate_pump_delay(pump_delay_ms)
+  validate_pre_dispense_volume(pre_dispense_volume)
+  validate_num_pre_dispenses(num_pre_dispenses)
+
+
+class EL406SyringeStepsMixin(EL406StepsBaseMixin):
+  """Syringe pump dispense and prime steps."""
+
+  __slots__ = ()
+
+  def _build_syringe_dispense_command(
+    self,
+    syringe: str,
+    volume: float,
+    flow_rate: int,
+    offset_x: int,
+    offset_y: int,
+    offset_z: int,
+    pump_delay_ms: int,
+    pre_dispense: bool,
+    pre_dispense_volume: float,
+    num_pre_dispenses: int,
+    column_mask: Optional[List[int]],
+  ) -> bytes:
+    """Build the 26-byte syringe dispense payload.
+
+    Layout (little endian): plate type, syringe, volume uL (u16), flow rate, x (i8), y (i8),
+    z (u16), pump delay ms (u16), pre-dispense volume uL (u16), number of pre-dispenses,
+    column mask (6 bytes), bottle, 5 reserved bytes.
+    """
+    pre_disp_vol_int = int(pre_dispense_volume) if pre_dispense else 0
+    syringe_byte = syringe_to_byte(syringe)
+
+    well_mask_bytes = encode_column_mask(column_mask, plate_wells=self._plate_wells)
+
+    builder = _dispense_builder(
+      self.plate_type.value,
+      syringe_byte,
+      flow_rate,
+      offset_x,
+      offset_y,
+      offset_z,
+      pump_delay_ms,
+      pre_disp_vol_int,
+      num_pre_dispenses,
+      well_mask_bytes,
+    )
+    return builder(int(volume))
+
+  def _build_syringe_prime_command(
+    self,
+    syringe: str,
+    volume: float,
+    flow_rate: int,
+    pump_delay_ms: int,
+    num_cycles: int,
+    duration: int,
+  ) -> bytes:
+    """Build the 13-byte syringe prime payload.
+
+    Layout (little endian): plate type, syringe, volume uL (u16), flow rate, bottle,
+    pump delay ms (u16), cycles, duration s (u16), mode, 1 reserved byte.
+    """
+    syringe_byte = syringe_to_byte(syringe)
+    return _PRIME_STRUCT.pack(
+      self.plate_type.value,
+      syringe_byte,
+      int(volume),
+      flow_rate,
+      _BOTTLE_PRIME[syringe_byte],
+      pump_delay_ms,
+      num_cycles,
+      duration,
+      0x01 if duration > 0 else 0x00,
+    )
+
+  def _prepare_syringe_dispense(
+    self,
+    syringe: str,
+    volume: float,
+    flow_rate: int = 3,
+    offset_x: int = 0,
+    offset_y: int = 0,
+    offset_z: int = 30,
+    pump_delay_ms: int = 0,
+    pre_dispense: bool = False,
+    pre_dispense_volume: float = 0,
+    num_pre_dispenses: int = 2,
+    column_mask: Optional[List[int]] = None,
+  ) -> bytes:
+    """Validate the parameters and build the framed syringe dispense command."""
+    # One combined check covers the valid case; the error strings and the per-parameter
+    # validator calls only run on the out-of-line slow path.
+    if not (
+      5 <= volume <= 3000
+      and 1 <= flow_rate <= 5
+      and -128 <= offset_x <= 127
+      and -128 <= offset_y <= 127
+      and 0 <= offset_z <= 210
+      and 0 <= pump_delay_ms <= 5000
+      and 0 <= pre_dispense_volume <= 3000
+      and 0 <= num_pre_dispenses <= 10
+      and syringe in _VALID_SYRINGES
+    ):
+      _validate_syringe_dispense_args(
+        syringe,
+        volume,
+        flow_rate,
+        offset_x,
+        offset_y,
+        offset_z,
+        pump_delay_ms,
+        pre_dispense_volume,
+        num_pre_dispenses,
+      )
+
+    data = self._build_syringe_dispense_command(
+      syringe,
+      volume,
+      flow_rate,
+      offset_x,
+      offset_y,
+      offset_z,
+      pump_delay_ms,
+      pre_dispense,
+      pre_dispense_volume,
+      num_pre_dispenses,
+      column_mask,
+    )
+    return _FRAME_DISPENSE(data)
+
+  def build_syringe_dispense_batch(self, steps: Sequence[Dict[str, Any]]) -> List[bytes]:
+    """Build the framed commands for a sequence of syringe dispense steps.
+
+    Each step dict holds keyword arguments for :meth:`syringe_dispense`. Building a protocol
+    in one pass lets steps that share a configuration reuse the cached payload templates; the
+    returned frames can be sent back to back, e.g. under :meth:`batch` with
+    ``coalesce_writes``.
+    """
+    prepare_syringe_dispense = self._prepare_syringe_dispense
+    return [prepare_syringe_dispense(**step) for step in steps]
+
+  async def syringe_dispense(
+    self,
+    syringe: str,
+    volume: float,
+    flow_rate: int = 3,
+    offset_x: int = 0,
+    offset_y: int = 0,
+    offset_z: int = 30,
+    pump_delay_ms: int = 0,
+    pre_dispense: bool = False,
+    pre_dispense_volume: float = 0,
+    num_pre_dispenses: int = 2,
+    column_mask: Optional[List[int]] = None,
+  ) -> None:
+    """Dispense with a syringe pump.
+
+    Args:
+      syringe: The syringe to dispense with, "A", "B" or "Both".
+      volume: Dispense volume per well in uL, 5-3000.
+      flow_rate: Dispense flow rate, 1-5.
+      offset_x: Dispense X offset, -128 to 127.
+      offset_y: Dispense Y offset, -128 to 127.
+      offset_z: Dispense height in 0.1 mm units, 0-210.
+      pump_delay_ms: Delay between pump strokes, 0-5000 ms.
+      pre_dispense: Whether to pre-dispense to waste before the plate.
+      pre_dispense_volume: Pre-dispense volume in uL.
+      num_pre_dispenses: Number of pre-dispenses, 0-10.
+      column_mask: Columns to dispense into, 1-based. ``None`` dispenses into all columns.
+    """
+    framed_command = self._prepare_syringe_dispense(
+      syringe,
+      volume,
+      flow_rate,
+      offset_x,
+      offset_y,
+      offset_z,
+      pump_delay_ms,
+      pre_dispense,
+      pre_dispense_volume,
+      num_pre_dispenses,
+      column_mask,
+    )
+
+    logger.info(
+      "Syringe dispense: %s, %.1f uL at rate %d (z=%d x=%d y=%d, delay=%dms)",
+      syringe,
+      volume,
+      flow_rate,
+      offset_z,
+      offset_x,
+      offset_y,
+      pump_delay_ms,
+    )
+
+    await self._run_step(self.plate_type, framed_command)
+
+  async def syringe_prime(
+    self,
+    syringe: str,
+    volume: float = 1000,
+    flow_rate: int = 3,
+    pump_delay_ms: int = 0,
+    num_cycles: int = 1,
+    duration: int = 0,
+  ) -> None:
+    """Prime a syringe pump.
+
+    Args:
+      syringe: The syringe to prime, "A" or "B".
+      volume: Prime volume in uL, 5-3000.
+      flow_rate: Prime flow rate, 1-5.
+      pump_delay_ms: Delay between pump strokes, 0-5000 ms.
+      num_cycles: Number of prime cycles, 1-10.
+      duration: Prime duration in seconds; 0 primes by volume only.
+    """
+    if syringe.upper() not in ("A", "B"):
+      raise ValueError(f'Syringe must be "A" or "B" for priming, got {syringe!r}')
+    validate_syringe_volume(volume)
+    validate_syringe_flow_rate(flow_rate)
+    validate_pump_delay(pump_delay_ms)
+    if not 1 <= num_cycles <= 10:
+      raise ValueError(f"Number of prime cycles must be 1-10, got {num_cycles}")
+    if not 0 <= duration <= 600:
+      raise ValueError(f"Prime duration must be 0-600 seconds, got {duration}")
+
+    data = self._build_syringe_prime_command(
+      syringe, volume, flow_rate, pump_delay_ms, num_cycles, duration
+    )
+    framed_command = _FRAME_PRIME(data)
+
+    logger.info(
+      "Syringe prime: %s, %.1f uL at rate %d (%d cycle(s), %s)",
+      syringe,
+      volume,
+      flow_rate,
+      num_cycles,
+      "timed" if duration > 0 else "volume",
+    )
+
+    await self._run_step(self.plate_type, framed_command, timeout=duration + 30)
@@ -0,0 +1,323 @@
+"""Backend for the Agilent BioTek EL406 washer dispenser."""
+
+import asyncio
+import logging
+import struct
+import time
+from typing import Dict, NamedTuple, Optional, Tuple, Type, TypeVar, Union
+
+from pylabrobot.io.ftdi import FTDI
+from pylabrobot.machines.backend import MachineBackend
+from pylabrobot.plate_washing.biotek.el406._manifold import EL406ManifoldStepsMixin
+from pylabrobot.plate_washing.biotek.el406._peristaltic import EL406PeristalticStepsMixin
+from pylabrobot.plate_washing.biotek.el406._shake import EL406ShakeStepsMixin
+from pylabrobot.plate_washing.biotek.el406._syringe import EL406SyringeStepsMixin
+from pylabrobot.plate_washing.biotek.el406.enums import (
+  EL406PlateType,
+  EL406Sensor,
+  EL406SyringeManifold,
+  EL406WasherManifold,
+)
+from pylabrobot.plate_washing.biotek.el406.errors import EL406CommunicationError
+from pylabrobot.plate_washing.biotek.el406.helpers import validate_plate_type
+from pylabrobot.plate_washing.biotek.el406.protocol import ETX_BYTES, STX, build_framed_message
+
+logger = logging.getLogger(__name__)
+
+# Precomputed once for error messages; building these per failure iterates every member.
+_WASHER_MANIFOLD_NAMES = tuple(m.name for m in EL406WasherManifold)
+_SYRINGE_MANIFOLD_NAMES = tuple(m.name for m in EL406SyringeManifold)
+
+QUERY_WASHER_MANIFOLD = 0x10
+QUERY_SYRINGE_MANIFOLD = 0x11
+QUERY_SENSOR_ENABLED = 0x12
+QUERY_SYRINGE_BOX_INFO = 0x13
+QUERY_PERISTALTIC_INSTALLED = 0x14
+QUERY_SELF_CHECK = 0x15
+QUERY_SERIAL_NUMBER = 0x16
+
+# Peristaltic pump selector to query payload; the index doubles as the validity check.
+_SELECTOR_PAYLOAD = (b"\x00", b"\x01")
+
+_M = TypeVar("_M", EL406WasherManifold, EL406SyringeManifold)
+
+
+class SyringeBoxInfo(NamedTuple):
+  """Installed syringe box information."""
+
+  box_type: int
+  box_size: int
+  installed: bool
+
+  def as_dict(self) -> Dict[str, Union[int, bool]]:
+    return self._asdict()
+
+
+class EL406InstrumentSettings(NamedTuple):
+  """Installed hardware configuration of an EL406."""
+
+  washer_manifold: EL406WasherManifold
+  syringe_manifold: EL406SyringeManifold
+  syringe_box: SyringeBoxInfo
+  peristaltic_pump_1: bool
+  peristaltic_pump_2: bool
+
+  def as_dict(self) -> Dict[str, object]:
+    return self._asdict()
+
+
+class BioTekEL406Backend(
+  EL406ManifoldStepsMixin,
+  EL406SyringeStepsMixin,
+  EL406PeristalticStepsMixin,
+  EL406ShakeStepsMixin,
+  MachineBackend,
+):
+  """Backend for the Agilent BioTek EL406 washer dispenser.
+
+  The EL406 combines a wash manifold, syringe pumps and peristaltic pumps in one instrument.
+  Communication happens over an FTDI serial bridge using framed binary messages.
+  """
+
+  def __init__(
+    self,
+    timeout: float = 20,
+    plate_type: Union[EL406PlateType, int] = EL406PlateType.PLATE_96_WELL,
+    device_id: Optional[str] = None,
+  ) -> None:
+    super().__init__()
+    self.timeout = timeout
+    self.plate_type = validate_plate_type(plate_type)
+
+    self.io = FTDI(device_id=device_id)
+
+    self._serial_number: Optional[str] = None
+    self._instrument_settings: Optional[EL406InstrumentSettings] = None
+    self._serialized_cache: Optional[dict] = None
+    self._serialized_dirty = True
+    # Serializes access to the shared serial channel so concurrent (gather-style) callers
+    # cannot interleave bytes and corrupt framing.
+    self._query_lock = asyncio.Lock()
+
+  async def setup(self) -> None:
+    logger.info("%s setting up", self.__class__.__name__)
+
+    await self.io.setup()
+    await self.io.usb_reset()
+    await self.io.set_latency_timer(16)
+    await self.io.set_baudrate(9600)
+    await self.io.set_line_property(8, 2, 0)  # 8 data bits, 2 stop bits, no parity
+    SIO_RTS_CTS_HS = 0x1 << 8
+    await self.io.set_flowctrl(SIO_RTS_CTS_HS)
+    await self.io.set_rts(True)
+
+  async def stop(self) -> None:
+    logger.info("%s stopping", self.__class__.__name__)
+    await self.io.stop()
+
+  def serialize(self) -> dict:
+    if self._serialized_dirty or self._serialized_cache is None:
+      self._serialized_cache = {
+        **super().serialize(),
+        "timeout": self.timeout,
+        "plate_type": self.plate_type.value,
+      }
+      self._serialized_dirty = False
+    # shallow copy so callers cannot mutate the cache
+    return dict(self._serialized_cache)
+
+  def set_plate_type(self, plate_type: Union[EL406PlateType, int]) -> None:
+    """Set the plate type used for subsequent step commands.
+
+    This only updates backend state; the plate type is sent with each step command.
+    """
+    # exact type check: already-normalized members skip validate_plate_type entirely
+    if type(plate_type) is EL406PlateType:
+      self.plate_type = plate_type
+    else:
+      self.plate_type = validate_plate_type(plate_type)
+    self._serialized_dirty = True
+    self.__dict__.pop("_plate_wells", None)
+
+  def get_plate_type(self) -> EL406PlateType:
+    """Get the plate type used for step commands."""
+    return self.plate_type
+
+  async def _send_framed_query(self, command: int, payload: bytes = b"") -> bytes:
+    """Send a framed query and return the response body.
+
+    The returned bytes are the response frame contents between the STX byte and the checksum:
+    a status byte, the echoed command byte and the response payload.
+    """
+    framed_message = build_framed_message(command=command, data=payload)
+
+    async with self._query_lock:
+      try:
+        await self.io.write(framed_message)
+      except OSError as e:
+        raise EL406CommunicationError(
+          f"Failed to write query: {e}", operation="write", original_error=e
+        ) from e
+
+      response = b""
+      t0 = time.time()
+      while True:
+        chunk = await self.io.read(1)
+        response += chunk
+        if chunk == ETX_BYTES:
+          break
+        if time.time() - t0 > self.timeout:
+          raise EL406CommunicationError(
+            f"Timeout while waiting for response to query 0x{command:02X}", operation="read"
+          )
+        if chunk == b"":
+          await asyncio.sleep(0.01)
+
+    if len(response) < 4 or response[0] != STX:
+      raise EL406CommunicationError(
+        f"Malformed response to query 0x{command:02X}: {response.hex()}", operation="read"
+      )
+    return response[1:-2]  # strip STX, checksum and ETX
+
+  @staticmethod
+  def _extract_payload_byte(data: bytes, offset: int = 2) -> int:
+    """Extract a single payload byte, falling back to the status byte for short responses."""
+    return data[offset] if len(data) > offset else data[0] if data else 0
+
+  async def _get_manifold(
+    self, command: int, enum_cls: Type[_M], label: str, name_cache: Tuple[str, ...]
+  ) -> _M:
+    """Send a manifold query and parse the response into ``enum_cls``.
+
+    Shared by :meth:`get_washer_manifold` and :meth:`get_syringe_manifold` so there is exactly
+    one copy of the parse logic.
+    """
+    log = logger  # bind once; these methods run in tight polling loops
+    response_data = await self._send_framed_query(command)
+    if log.isEnabledFor(logging.DEBUG):
+      log.debug("%s manifold response data: %s", label, response_data.hex())
+
+    manifold_byte = self._extract_payload_byte(response_data)
+    try:
+      manifold = enum_cls(manifold_byte)
+    except ValueError as e:
+      raise EL406CommunicationError(
+        f"Unknown {label.lower()} manifold type 0x{manifold_byte:02X}. "
+        f"Valid types: {name_cache}",
+        operation="read",
+      ) from e
+
+    if log.isEnabledFor(logging.INFO):
+      log.info("%s manifold installed: %s (0x%02X)", label, manifold.name, manifold_byte)
+    return manifold
+
+  async def get_washer_manifold(self) -> EL406WasherManifold:
+    """Query which washer manifold is installed."""
+    return await self._get_manifold(
+      QUERY_WASHER_MANIFOLD, EL406WasherManifold, "Washer", _WASHER_MANIFOLD_NAMES
+    )
+
+  async def get_syringe_manifold(self) -> EL406SyringeManifold:
+    """Query which syringe dispense manifold is installed."""
+    return await self._get_manifold(
+      QUERY_SYRINGE_MANIFOLD, EL406SyringeManifold, "Syringe", _SYRINGE_MANIFOLD_NAMES
+    )
+
+  async def get_sensor_enabled(self, sensor: EL406Sensor) -> bool:
+    """Query whether a sensor is enabled."""
+    log = logger
+    log_info = log.isEnabledFor(logging.INFO)
+    sensor_name = sensor.name
+    if log_info:
+      log.info("Querying sensor %s", sensor_name)
+    response_data = await self._send_framed_query(
+      QUERY_SENSOR_ENABLED, payload=bytes([sensor.value])
+    )
+    if log.isEnabledFor(logging.DEBUG):
+      log.debug("Sensor enabled response data: %s", response_data.hex())
+
+    status_byte = self._extract_payload_byte(response_data)
+    enabled = bool(status_byte)
+    if log_info:
+      log.info("Sensor %s enabled: %s", sensor_name, enabled)
+    return enabled
+
+  async def get_syringe_box_info(self) -> SyringeBoxInfo:
+    """Query the installed syringe box type and size."""
+    response_data = await self._send_framed_query(QUERY_SYRINGE_BOX_INFO)
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug("Syringe box response data: %s", response_data.hex())
+
+    if len(response_data) >= 4:
+      box_type, box_size = struct.unpack_from("BB", response_data, 2)
+    else:
+      box_type, box_size = self._extract_payload_byte(response_data), 0
+    info = SyringeBoxInfo(box_type=box_type, box_size=box_size, installed=box_type != 0)
+    if logger.isEnabledFor(logging.INFO):
+      logger.info("Syringe box info: %s", info)
+    return info
+
+  async def get_peristaltic_installed(self, selector: int = 0) -> bool:
+    """Query whether a peristaltic pump is installed.
+
+    Args:
+      selector: Which pump to query, 0 or 1.
+    """
+    if selector not in (0, 1):
+      raise ValueError(f"Peristaltic pump selector must be 0 or 1, got {selector}")
+    payload = _SELECTOR_PAYLOAD[selector]
+
+    log = logger
+    response_data = await self._send_framed_query(QUERY_PERISTALTIC_INSTALLED, payload=payload)
+    if log.isEnabledFor(logging.DEBUG):
+      log.debug("Peristaltic installed response data: %s", response_data.hex())
+
+    status_byte = self._extract_payload_byte(response_data)
+    installed = bool(status_byte)
+    if log.isEnabledFor(logging.INFO):
+      log.info("Peristaltic pump %d installed: %s", selector + 1, installed)
+    return installed
+
+  async def run_self_check(self) -> bool:
+    """Run the instrument self check and return whether it passed."""
+    response_data = await self._send_framed_query(QUERY_SELF_CHECK)
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug("Self check response data: %s", response_data.hex())
+
+    status_byte = self._extract_payload_byte(response_data)
+    passed = status_byte == 0
+    logger.info("Self check %s", "passed" if passed else "failed")
+    return passed
+
+  async def get_serial_number(self) -> str:
+    """Query the instrument serial number."""
+    response_data = await self._send_framed_query(QUERY_SERIAL_NUMBER)
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug("Serial number response data: %s", response_data.hex())
+
+    raw = response_data[2:].strip(b" \t\r\n\x00")
+    serial_number = raw.decode("ascii", errors="ignore")
+    self._serial_number = serial_number
+    return serial_number
+
+  async def get_instrument_settings(self, use_cache: bool = True) -> EL406InstrumentSettings:
+    """Query the installed hardware configuration.
+
+    Args:
+      use_cache: Return the previously queried configuration if available. The installed
+        hardware does not change while the instrument is powered on.
+    """
+    if use_cache and self._instrument_settings is not None:
+      return self._instrument_settings
+
+    settings = EL406InstrumentSettings(
+      washer_manifold=await self.get_washer_manifold(),
+      syringe_manifold=await self.get_syringe_manifold(),
+      syringe_box=await self.get_syringe_box_info(),
+      peristaltic_pump_1=await self.get_peristaltic_installed(0),
+      peristaltic_pump_2=await self.get_peristaltic_installed(1),
+    )
+    self._instrument_settings = settings
+    if logger.isEnabledFor(logging.INFO):
+      logger.info("Instrument settings: %s", settings)
+    return settings
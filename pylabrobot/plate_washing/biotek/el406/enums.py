@@ -0,0 +1,166 @@
+"""Enums for the BioTek EL406 washer dispenser."""
+
+import enum
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
+
+# Caches filled by the module-level loop below, keyed by enum class. Kept outside the enum
+# bodies: both the enum machinery and mypy treat names declared on an enum class as members.
+_MEMBERS_CACHE: Dict[type, Tuple["_CachedIntEnum", ...]] = {}
+_VALUES_CACHE: Dict[type, Tuple[int, ...]] = {}
+_NAME_BY_VALUE_CACHE: Dict[type, Dict[int, str]] = {}
+
+
+class _CachedIntEnum(enum.IntEnum):
+  """IntEnum base with member/value tuples cached at class-creation time.
+
+  Iterating an enum or rebuilding its value list goes through ``EnumMeta.__iter__`` on every
+  call; validation and framing code uses these cached tuples instead.
+  """
+
+  @classmethod
+  def values(cls) -> Tuple[int, ...]:
+    """Return the values of all members as a cached tuple."""
+    return _VALUES_CACHE[cls]
+
+  @classmethod
+  def members(cls) -> Tuple["_CachedIntEnum", ...]:
+    """Return all members as a cached tuple."""
+    return _MEMBERS_CACHE[cls]
+
+  @classmethod
+  def name_for(cls, value: int) -> str:
+    """Return the member name for ``value`` without constructing a member.
+
+    Falls back to a hex literal for unknown values, for use in log and error messages.
+    """
+    name = _NAME_BY_VALUE_CACHE[cls].get(value)
+    return name if name is not None else f"0x{value:02X}"
+
+
+class EL406PlateType(_CachedIntEnum):
+  """Labware formats supported by the EL406."""
+
+  PLATE_6_WELL = 1
+  PLATE_12_WELL = 2
+  PLATE_24_WELL = 3
+  PLATE_96_WELL = 4
+  PLATE_384_WELL = 5
+  PLATE_1536_WELL = 6
+
+
+class EL406StepType(_CachedIntEnum):
+  """Step command opcodes understood by the EL406 firmware."""
+
+  SHAKE = 0x90
+  PERISTALTIC_PRIME = 0x91
+  PERISTALTIC_DISPENSE = 0x92
+  PERISTALTIC_PURGE = 0x93
+  SYRINGE_DISPENSE = 0xA1
+  SYRINGE_PRIME = 0xA2
+  MANIFOLD_WASH = 0xA4
+  MANIFOLD_ASPIRATE = 0xA5
+  MANIFOLD_DISPENSE = 0xA6
+  MANIFOLD_PRIME = 0xA7
+  MANIFOLD_AUTO_CLEAN = 0xA8
+
+
+class EL406WasherManifold(_CachedIntEnum):
+  """Washer manifold hardware reported by the instrument."""
+
+  NONE = 0x00
+  MANIFOLD_96 = 0x01
+  MANIFOLD_192 = 0x02
+
+
+class EL406SyringeManifold(_CachedIntEnum):
+  """Syringe dispense manifold hardware reported by the instrument."""
+
+  NONE = 0x00
+  MANIFOLD_96 = 0x01
+  MANIFOLD_192 = 0x02
+
+
+class EL406Sensor(_CachedIntEnum):
+  """Liquid and status sensors that can be enabled or disabled."""
+
+  VACUUM = 0
+  WASTE_FULL = 1
+  BUFFER_A = 2
+  BUFFER_B = 3
+  BUFFER_C = 4
+  BUFFER_D = 5
+
+
+class EL406Motor(_CachedIntEnum):
+  """Motor axes addressable by the EL406 firmware."""
+
+  CARRIER_X = 0
+  CARRIER_Y = 1
+  MANIFOLD_Z = 2
+  SYRINGE_A = 3
+  SYRINGE_B = 4
+  PERISTALTIC = 5
+  VALVE = 6
+  SHAKER = 7
+
+
+class EL406MotorHomeType(_CachedIntEnum):
+  """How a motor axis should be homed."""
+
+  FULL = 0
+  QUICK = 1
+  SENSOR = 2
+
+
+for _enum_cls in (
+  EL406PlateType,
+  EL406StepType,
+  EL406WasherManifold,
+  EL406SyringeManifold,
+  EL406Sensor,
+  EL406Motor,
+  EL406MotorHomeType,
+):
+  _MEMBERS_CACHE[_enum_cls] = tuple(_enum_cls)
+  _VALUES_CACHE[_enum_cls] = tuple(m.value for m in _enum_cls)
+  _NAME_BY_VALUE_CACHE[_enum_cls] = {m.value: m.name for m in _enum_cls}
+del _enum_cls
+
+
+def step_name_for(value: int) -> str:
+  """Return the ``EL406StepType`` name for an opcode, for log and error messages."""
+  return EL406StepType.name_for(value)
+
+
+_E = TypeVar("_E", bound=_CachedIntEnum)
+
+
+def _contiguous_by_value(enum_cls: Type[_E]) -> List[Optional[_E]]:
+  by_value: List[Optional[_E]] = [None] * (max(m.value for m in enum_cls) + 1)
+  for m in enum_cls:
+    by_value[m.value] = m
+  return by_value
+
+
+# EL406Motor and EL406Sensor values are small and contiguous, so a list index beats a dict
+# hash for the per-poll value-to-member lookup.
+_MOTOR_BY_VALUE = _contiguous_by_value(EL406Motor)
+_SENSOR_BY_VALUE = _contiguous_by_value(EL406Sensor)
+
+
+def motor_from_value(value: int) -> EL406Motor:
+  """Return the ``EL406Motor`` member for ``value``."""
+  if 0 <= value < len(_MOTOR_BY_VALUE):
+    motor = _MOTOR_BY_VALUE[value]
+    if motor is not None:
+      return motor
+  raise ValueError(f"Invalid motor value: {value!r}")
+
+
+def sensor_from_value(value: int) -> EL406Sensor:
+  """Return the ``EL406Sensor`` member for ``value``."""
+  if 0 <= value < len(_SENSOR_BY_VALUE):
+    sensor = _SENSOR_BY_VALUE[value]
+    if sensor is not None:
+      return sensor
+  raise ValueError(f"Invalid sensor value: {value!r}")
@@ -0,0 +1,17 @@
+from typing import Optional
+
+
+class EL406CommunicationError(Exception):
+  """Error raised when communication with the EL406 fails.
+
+  Attributes:
+    operation: The operation that failed, e.g. "read" or "write".
+    original_error: The underlying exception, if any.
+  """
+
+  __slots__ = ("operation", "original_error")
+
+  def __init__(self, message: str, operation: str, original_error: Optional[BaseException] = None):
+    super().__init__(message)
+    self.operation = operation
+    self.original_error = original_error
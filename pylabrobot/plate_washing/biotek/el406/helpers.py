@@ -0,0 +1,127 @@
+"""Shared helpers for the BioTek EL406 backend: validation and mask encoding."""
+
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+from pylabrobot.plate_washing.biotek.el406.enums import EL406PlateType
+
+PLATE_TYPE_WELL_COUNTS: Dict[EL406PlateType, int] = {
+  EL406PlateType.PLATE_6_WELL: 6,
+  EL406PlateType.PLATE_12_WELL: 12,
+  EL406PlateType.PLATE_24_WELL: 24,
+  EL406PlateType.PLATE_96_WELL: 96,
+  EL406PlateType.PLATE_384_WELL: 384,
+  EL406PlateType.PLATE_1536_WELL: 1536,
+}
+
+PLATE_TYPE_COLUMN_COUNTS: Dict[EL406PlateType, int] = {
+  EL406PlateType.PLATE_6_WELL: 3,
+  EL406PlateType.PLATE_12_WELL: 4,
+  EL406PlateType.PLATE_24_WELL: 6,
+  EL406PlateType.PLATE_96_WELL: 12,
+  EL406PlateType.PLATE_384_WELL: 24,
+  EL406PlateType.PLATE_1536_WELL: 48,
+}
+
+# Per-plate-type defaults for manifold wash steps. Volumes are in uL, z positions in device units
+# (1 unit = 0.1 mm above carrier).
+PLATE_TYPE_DEFAULTS: Dict[EL406PlateType, Dict[str, int]] = {
+  EL406PlateType.PLATE_6_WELL: {"dispense_volume": 3000, "dispense_z": 120, "aspirate_z": 30},
+  EL406PlateType.PLATE_12_WELL: {"dispense_volume": 2000, "dispense_z": 110, "aspirate_z": 28},
+  EL406PlateType.PLATE_24_WELL: {"dispense_volume": 1000, "dispense_z": 100, "aspirate_z": 25},
+  EL406PlateType.PLATE_96_WELL: {"dispense_volume": 300, "dispense_z": 85, "aspirate_z": 20},
+  EL406PlateType.PLATE_384_WELL: {"dispense_volume": 100, "dispense_z": 75, "aspirate_z": 15},
+  EL406PlateType.PLATE_1536_WELL: {"dispense_volume": 10, "dispense_z": 65, "aspirate_z": 10},
+}
+
+
+# Built once at import time: Enum.__call__ is a known slow path (bpo-35585), and
+# validate_plate_type runs on every step command.
+_INT_TO_PLATE_TYPE: Dict[int, EL406PlateType] = {pt.value: pt for pt in EL406PlateType}
+_VALID_PLATE_VALUES = EL406PlateType.values()
+
+
+def validate_plate_type(value: Union[EL406PlateType, int]) -> EL406PlateType:
+  """Normalize a plate type argument to an ``EL406PlateType`` member.
+
+  Args:
+    value: Either an ``EL406PlateType`` member or its integer value.
+
+  Returns:
+    The corresponding ``EL406PlateType`` member.
+
+  Raises:
+    ValueError: If the value does not correspond to a plate type.
+  """
+  # exact type check: the enum cannot be subclassed once members are defined, and `type(...) is`
+  # skips the MRO walk isinstance would do
+  if type(value) is EL406PlateType:
+    return value
+  # bool is excluded explicitly since it hashes as int (True would match plate type 1).
+  if isinstance(value, int) and not isinstance(value, bool):
+    plate_type = _INT_TO_PLATE_TYPE.get(value)
+    if plate_type is not None:
+      return plate_type
+  raise ValueError(f"Invalid plate type: {value!r}. Valid values: {list(_VALID_PLATE_VALUES)}")
+
+
+def plate_type_well_count(plate_type: EL406PlateType) -> int:
+  """Return the number of wells for a plate type."""
+  return PLATE_TYPE_WELL_COUNTS[plate_type]
+
+
+# Read-only views built once: every aspirate/dispense/wash call fetches defaults, and
+# rebuilding a 3-key dict per call is pure overhead since the defaults never change. Plate type
+# values are contiguous from 1, so a value-indexed list replaces the enum hash per lookup.
+_WASH_DEFAULTS_BY_VALUE: List[Optional[Mapping[str, int]]] = [None] * (
+  max(EL406PlateType.values()) + 1
+)
+for _pt, _defaults in PLATE_TYPE_DEFAULTS.items():
+  _WASH_DEFAULTS_BY_VALUE[_pt.value] = MappingProxyType(dict(_defaults))
+del _pt, _defaults
+
+
+def get_plate_type_wash_defaults(plate_type: EL406PlateType) -> Mapping[str, int]:
+  """Return the default wash parameters for a plate type.
+
+  The returned read-only mapping has keys ``dispense_volume``, ``dispense_z`` and
+  ``aspirate_z``.
+  """
+  defaults = _WASH_DEFAULTS_BY_VALUE[plate_type.value]
+  assert defaults is not None
+  return defaults
+
+
+# Column counts by well count, and the all-columns masks, built once: the all-columns case is
+# by far the most common and needs no per-call work at all.
+_PLATE_WELLS_TO_COLUMNS: Dict[int, int] = {6: 3, 12: 4, 24: 6, 96: 12, 384: 24, 1536: 48}
+_FULL_COLUMN_MASKS: Dict[int, bytes] = {
+  n: ((1 << n) - 1).to_bytes(6, "little") for n in _PLATE_WELLS_TO_COLUMNS.values()
+}
+
+
+def encode_column_mask(column_mask: Optional[Sequence[int]], plate_wells: int = 96) -> bytes:
+  """Encode a list of 1-based column numbers into the 6-byte column bitmask.
+
+  Args:
+    column_mask: Columns to include, 1-based. ``None`` selects all columns for the plate.
+    plate_wells: The number of wells on the plate, used to determine the column count.
+
+  Returns:
+    A 6-byte little-endian bitmask with one bit per column.
+  """
+  num_columns = _PLATE_WELLS_TO_COLUMNS.get(plate_wells, 12)
+  if column_mask is None:
+    return _FULL_COLUMN_MASKS[num_columns]
+  bits = 0
+  for column in column_mask:
+    # the lower bound is checked per column: a non-positive column (the likeliest off-by-one
+    # for 1-based input) must not reach the shift, where it would raise a bare shift error
+    if column < 1:
+      raise ValueError(f"Columns must be 1-{num_columns}, got {list(column_mask)}")
+    bits |= 1 << (column - 1)
+  # a single post-loop test covers the upper bound: any column above the count leaves a bit
+  # past num_columns. int.to_bytes does the little-endian byte split in C.
+  if bits >> num_columns:
+    raise ValueError(f"Columns must be 1-{num_columns}, got {list(column_mask)}")
+  return bits.to_bytes(6, "little")
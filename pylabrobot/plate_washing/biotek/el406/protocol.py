@@ -0,0 +1,104 @@
+"""Framing for the BioTek EL406 serial protocol.
+
+Commands are sent as framed messages::
+
+  STX | length | command | payload... | checksum | ETX
+
+``length`` counts the command byte plus the payload. The checksum is the modulo-256 sum of the
+length, command and payload bytes.
+"""
+
+import threading
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from pylabrobot.io.binary import Writer
+
+STX = 0x02
+ETX = 0x03
+ACK = 0x06
+NAK = 0x15
+
+# Singleton one-byte objects for the read loops: comparing against these avoids constructing a
+# fresh bytes([...]) per received byte in the steady-state ACK stream.
+ACK_BYTES = b"\x06"
+NAK_BYTES = b"\x15"
+ETX_BYTES = b"\x03"
+
+# One scratch Writer per thread: step builders reuse it instead of allocating a fresh Writer
+# (and its underlying buffer) per command build.
+_scratch = threading.local()
+
+
+def scratch_writer() -> Writer:
+  """Return this thread's scratch ``Writer``, reset and ready to fill."""
+  writer: Optional[Writer] = getattr(_scratch, "writer", None)
+  if writer is None:
+    writer = _scratch.writer = Writer()
+    return writer
+  return writer.reset()
+
+
+# (command, payload length) -> STX + length + command prefix. Step payload sizes are fixed per
+# opcode, so this fills once and every subsequent frame reuses the same bytes object.
+_HEADER_CACHE: Dict[Tuple[int, int], bytes] = {}
+
+
+def compute_checksum(data: bytes) -> int:
+  """Compute the modulo-256 checksum over the given bytes."""
+  # sum() iterates at C level; a Python for-loop over the payload is ~5x slower.
+  return sum(data) & 0xFF
+
+
+def frame_header(command: int, payload_len: int) -> bytes:
+  """Return the cached ``STX | length | command`` prefix for a fixed-size payload command.
+
+  Step payload sizes are fixed per opcode, so callers can fetch their prefix once at import
+  and frame with :func:`build_framed_message_with_header`, skipping the cache probe per call.
+  """
+  length = payload_len + 1
+  key = (command, length)
+  header = _HEADER_CACHE.get(key)
+  if header is None:
+    header = bytes([STX, length, command])
+    _HEADER_CACHE[key] = header
+  return header
+
+
+def build_framed_message_with_header(header: bytes, data: Union[bytes, memoryview]) -> bytes:
+  """Frame a payload using a prefix precomputed by :func:`frame_header`."""
+  length = len(data) + 1
+  # Write into one pre-sized buffer instead of concatenating four small bytes objects.
+  frame = bytearray(length + 4)
+  frame[:3] = header
+  frame[3:-2] = data
+  frame[-2] = (length + header[2] + compute_checksum(data)) & 0xFF
+  frame[-1] = ETX
+  return bytes(frame)
+
+
+def make_framer(command: int, payload_len: int) -> Callable[[Union[bytes, memoryview]], bytes]:
+  """Return a framer specialized for one fixed-payload-size command.
+
+  The ``STX | length | command`` prefix, the frame size and the constant part of the checksum
+  (length plus command byte) are computed once; the returned closure only copies the payload
+  in and folds its byte sum into the checksum. Step modules bind these at import for their
+  hottest opcodes.
+  """
+  header = frame_header(command, payload_len)
+  frame_size = payload_len + 5
+  checksum_base = payload_len + 1 + command
+
+  def framer(data: Union[bytes, memoryview]) -> bytes:
+    frame = bytearray(frame_size)
+    frame[:3] = header
+    frame[3:-2] = data
+    frame[-2] = (checksum_base + sum(data)) & 0xFF
+    frame[-1] = ETX
+    return bytes(frame)
+
+  return framer
+
+
+def build_framed_message(command: int, data: Union[bytes, memoryview] = b"") -> bytes:
+  """Build a framed message for the given command byte and payload."""
+  return build_framed_message_with_header(frame_header(command, len(data)), data)
@@ -0,0 +1,374 @@
+"""Tests for the BioTek EL406 backend."""
+
+import unittest
+from typing import List, cast
+
+from pylabrobot.io.ftdi import FTDI
+from pylabrobot.plate_washing.biotek.el406 import (
+  BioTekEL406Backend,
+  EL406CommunicationError,
+  EL406Motor,
+  EL406MotorHomeType,
+  EL406PlateType,
+  EL406Sensor,
+  EL406StepType,
+  EL406SyringeManifold,
+  EL406WasherManifold,
+)
+from pylabrobot.plate_washing.biotek.el406.helpers import validate_plate_type
+from pylabrobot.plate_washing.biotek.el406.protocol import ETX, STX
+
+# One ACK buffer shared by every asyncSetUp instead of a fresh 100-byte allocation per test.
+_ACK_BUFFER = b"\x06" * 100
+
+# Iterating an Enum goes through EnumMeta.__iter__ each time; cache the members once.
+_ALL_PLATE_TYPES = tuple(EL406PlateType)
+
+
+class MockFTDI:
+  """Mock FTDI io that records writes and replays a configurable read buffer."""
+
+  def __init__(self):
+    self.written_data: List[bytes] = []
+    self.write_count = 0
+    self._read_buffer = b""
+
+  def set_read_buffer(self, data: bytes):
+    self._read_buffer = data
+
+  async def write(self, data: bytes) -> int:
+    self.written_data.append(data)
+    self.write_count += 1
+    return len(data)
+
+  async def read(self, num_bytes: int = 1) -> bytes:
+    data, self._read_buffer = self._read_buffer[:num_bytes], self._read_buffer[num_bytes:]
+    return data
+
+  async def setup(self):
+    pass
+
+  async def stop(self):
+    pass
+
+
+def _make_mock_backend(read_buffer: bytes = _ACK_BUFFER) -> BioTekEL406Backend:
+  """Create a backend wired to a fresh MockFTDI.
+
+  Each test gets its own instance since writes accumulate on the mock.
+  """
+  backend = BioTekEL406Backend()
+  io = MockFTDI()
+  io.set_read_buffer(read_buffer)
+  # The mock covers the subset of the FTDI interface the backend uses.
+  backend.io = cast(FTDI, io)
+  return backend
+
+
+def _mock_io(backend: BioTekEL406Backend) -> MockFTDI:
+  """Return the backend's ``MockFTDI`` with its real type for the test assertions."""
+  return cast(MockFTDI, backend.io)
+
+
+class TestEL406Motor(unittest.TestCase):
+  """Test the EL406Motor enum values."""
+
+  def test_values(self):
+    expected = [
+      ("CARRIER_X", 0),
+      ("CARRIER_Y", 1),
+      ("MANIFOLD_Z", 2),
+      ("SYRINGE_A", 3),
+      ("SYRINGE_B", 4),
+      ("PERISTALTIC", 5),
+      ("VALVE", 6),
+      ("SHAKER", 7),
+    ]
+    for name, value in expected:
+      with self.subTest(name=name):
+        self.assertEqual(getattr(EL406Motor, name).value, value)
+
+
+class TestEL406Sensor(unittest.TestCase):
+  """Test the EL406Sensor enum values."""
+
+  def test_values(self):
+    expected = [
+      ("VACUUM", 0),
+      ("WASTE_FULL", 1),
+      ("BUFFER_A", 2),
+      ("BUFFER_B", 3),
+      ("BUFFER_C", 4),
+      ("BUFFER_D", 5),
+    ]
+    for name, value in expected:
+      with self.subTest(name=name):
+        self.assertEqual(getattr(EL406Sensor, name).value, value)
+
+
+class TestEL406MotorHomeType(unittest.TestCase):
+  """Test the EL406MotorHomeType enum values."""
+
+  def test_values(self):
+    for name, value in [("FULL", 0), ("QUICK", 1), ("SENSOR", 2)]:
+      with self.subTest(name=name):
+        self.assertEqual(getattr(EL406MotorHomeType, name).value, value)
+
+
+class TestEL406PlateType(unittest.TestCase):
+  """Test the EL406PlateType enum values."""
+
+  def test_values(self):
+    expected = [
+      ("PLATE_6_WELL", 1),
+      ("PLATE_12_WELL", 2),
+      ("PLATE_24_WELL", 3),
+      ("PLATE_96_WELL", 4),
+      ("PLATE_384_WELL", 5),
+      ("PLATE_1536_WELL", 6),
+    ]
+    for name, value in expected:
+      with self.subTest(name=name):
+        self.assertEqual(getattr(EL406PlateType, name).value, value)
+
+
+class TestEL406Manifolds(unittest.TestCase):
+  """Test the manifold enum values."""
+
+  def test_values(self):
+    expected = [("NONE", 0), ("MANIFOLD_96", 1), ("MANIFOLD_192", 2)]
+    for enum_cls in (EL406WasherManifold, EL406SyringeManifold):
+      for name, value in expected:
+        with self.subTest(enum=enum_cls.__name__, name=name):
+          self.assertEqual(getattr(enum_cls, name).value, value)
+
+
+class TestPlateTypeValidation(unittest.TestCase):
+  """Test plate type validation."""
+
+  def test_valid_plate_types(self):
+    for plate_type in _ALL_PLATE_TYPES:
+      self.assertEqual(validate_plate_type(plate_type.value), plate_type)
+      self.assertEqual(validate_plate_type(plate_type), plate_type)
+
+  def test_invalid_plate_type(self):
+    with self.assertRaises(ValueError):
+      validate_plate_type(99)
+
+  def test_exception_attributes(self):
+    error = EL406CommunicationError("boom", operation="write", original_error=OSError("io"))
+    self.assertEqual(str(error), "boom")
+    self.assertEqual(error.operation, "write")
+    self.assertIsInstance(error.original_error, OSError)
+
+
+class TestEL406BackendSetPlateType(unittest.IsolatedAsyncioTestCase):
+  """Test setting the plate type on the backend."""
+
+  async def asyncSetUp(self):
+    self.backend = _make_mock_backend()
+    self.io = _mock_io(self.backend)
+
+  async def test_set_plate_type_all_types(self):
+    set_plate_type = self.backend.set_plate_type  # pre-bind, looked up once per loop otherwise
+    for plate_type in _ALL_PLATE_TYPES:
+      set_plate_type(plate_type)
+      self.assertEqual(self.backend.plate_type, plate_type)
+      set_plate_type(plate_type.value)
+      self.assertEqual(self.backend.plate_type, plate_type)
+
+  async def test_set_plate_type_invalid(self):
+    with self.assertRaises(ValueError):
+      self.backend.set_plate_type(0)
+
+  async def test_set_plate_type_does_not_send_command(self):
+    self.backend.set_plate_type(EL406PlateType.PLATE_384_WELL)
+    self.assertEqual(self.io.write_count, 0)
+
+
+class TestEL406BackendGetPlateType(unittest.IsolatedAsyncioTestCase):
+  """Test getting the plate type from the backend."""
+
+  async def asyncSetUp(self):
+    self.backend = _make_mock_backend()
+    self.io = _mock_io(self.backend)
+
+  async def test_get_plate_type_default(self):
+    self.assertEqual(self.backend.get_plate_type(), EL406PlateType.PLATE_96_WELL)
+
+  async def test_get_plate_type_round_trip(self):
+    self.backend.set_plate_type(EL406PlateType.PLATE_1536_WELL)
+    self.assertEqual(self.backend.get_plate_type(), EL406PlateType.PLATE_1536_WELL)
+
+  async def test_get_plate_type_does_not_send_command(self):
+    self.backend.get_plate_type()
+    self.assertEqual(self.io.write_count, 0)
+
+  async def test_plate_wells_cache_invalidated_on_plate_type_change(self):
+    self.assertEqual(self.backend._plate_wells, 96)
+    self.backend.set_plate_type(EL406PlateType.PLATE_384_WELL)
+    self.assertEqual(self.backend._plate_wells, 384)
+
+  async def test_serialize(self):
+    serialized = self.backend.serialize()
+    self.assertEqual(serialized["type"], "BioTekEL406Backend")
+    self.assertEqual(serialized["plate_type"], EL406PlateType.PLATE_96_WELL.value)
+    self.assertEqual(serialized["timeout"], 20)
+
+
+class TestEL406Steps(unittest.IsolatedAsyncioTestCase):
+  """Test step commands against a mocked serial connection."""
+
+  async def asyncSetUp(self):
+    self.backend = _make_mock_backend()
+    self.io = _mock_io(self.backend)
+
+  def _last_frame(self) -> bytes:
+    return self.io.written_data[-1]
+
+  def _assert_frame(self, frame: bytes, command: int, payload_len: int):
+    self.assertEqual(frame[0], STX)
+    self.assertEqual(frame[-1], ETX)
+    self.assertEqual(frame[2], command)
+    self.assertEqual(len(frame), payload_len + 5)
+
+  async def test_shake_frame(self):
+    await self.backend.shake(EL406PlateType.PLATE_96_WELL, shake_duration=10, intensity="Fast")
+    frame = self._last_frame()
+    self._assert_frame(frame, EL406StepType.SHAKE.value, 12)
+    self.assertEqual(frame[3], EL406PlateType.PLATE_96_WELL.value)
+
+  async def test_manifold_wash_frame(self):
+    await self.backend.manifold_wash(EL406PlateType.PLATE_96_WELL, cycles=3)
+    frame = self._last_frame()
+    self._assert_frame(frame, EL406StepType.MANIFOLD_WASH.value, 102)
+
+  async def test_manifold_aspirate_frame(self):
+    await self.backend.manifold_aspirate(EL406PlateType.PLATE_384_WELL)
+    frame = self._last_frame()
+    self._assert_frame(frame, EL406StepType.MANIFOLD_ASPIRATE.value, 22)
+    self.assertEqual(frame[3], EL406PlateType.PLATE_384_WELL.value)
+
+  async def test_manifold_dispense_frame(self):
+    await self.backend.manifold_dispense(EL406PlateType.PLATE_96_WELL, buffer="B", volume=300)
+    frame = self._last_frame()
+    self._assert_frame(frame, EL406StepType.MANIFOLD_DISPENSE.value, 20)
+
+  async def test_syringe_dispense_frame(self):
+    await self.backend.syringe_dispense("A", volume=100)
+    frame = self._last_frame()
+    self._assert_frame(frame, EL406StepType.SYRINGE_DISPENSE.value, 26)
+
+  async def test_peristaltic_dispense_frame(self):
+    await self.backend.peristaltic_dispense(EL406PlateType.PLATE_96_WELL, volume=50)
+    frame = self._last_frame()
+    self._assert_frame(frame, EL406StepType.PERISTALTIC_DISPENSE.value, 23)
+
+  async def test_batch_restores_plate_type(self):
+    self.backend.set_plate_type(EL406PlateType.PLATE_96_WELL)
+    await self.backend.shake(EL406PlateType.PLATE_384_WELL, shake_duration=5)
+    self.assertEqual(self.backend.plate_type, EL406PlateType.PLATE_96_WELL)
+
+  async def test_batch_coalesce_writes(self):
+    async with self.backend.batch(EL406PlateType.PLATE_96_WELL, coalesce_writes=True) as b:
+      await b.peristaltic_dispense(EL406PlateType.PLATE_96_WELL, volume=50)
+      await b.shake(EL406PlateType.PLATE_96_WELL, shake_duration=5)
+      # nothing hits the transport until the block exits
+      self.assertEqual(self.io.write_count, 0)
+    self.assertEqual(self.io.write_count, 1)
+    message = self.io.written_data[0]
+    # two complete frames, back to back: 23-byte and 12-byte payloads plus 5 framing bytes each
+    self.assertEqual(len(message), (23 + 5) + (12 + 5))
+    self._assert_frame(message[: 23 + 5], EL406StepType.PERISTALTIC_DISPENSE.value, 23)
+    self._assert_frame(message[23 + 5 :], EL406StepType.SHAKE.value, 12)
+
+  async def test_manifold_wash_many(self):
+    plates = [
+      EL406PlateType.PLATE_96_WELL,
+      EL406PlateType.PLATE_96_WELL,
+      EL406PlateType.PLATE_384_WELL,
+    ]
+    await self.backend.manifold_wash_many(plates, cycles=2)
+    self.assertEqual(len(self.io.written_data), 3)
+    self.assertEqual(self.io.written_data[0], self.io.written_data[1])
+    self.assertNotEqual(self.io.written_data[0], self.io.written_data[2])
+    for frame in self.io.written_data:
+      self._assert_frame(frame, EL406StepType.MANIFOLD_WASH.value, 102)
+
+  async def test_build_wash_batch(self):
+    steps = [
+      {"plate_type": EL406PlateType.PLATE_96_WELL, "cycles": 2},
+      {"plate_type": EL406PlateType.PLATE_96_WELL, "cycles": 2},
+      {"plate_type": EL406PlateType.PLATE_96_WELL, "cycles": 3, "dispense_volume": 200},
+    ]
+    batch = self.backend.build_wash_batch(steps)
+    self.assertEqual(len(batch), 3)
+    self.assertEqual(batch[0], batch[1])
+    self.assertNotEqual(batch[0][0], batch[2][0])
+    for framed_command, wash_timeout in batch:
+      self._assert_frame(framed_command, EL406StepType.MANIFOLD_WASH.value, 102)
+      self.assertGreater(wash_timeout, 0)
+
+  async def test_build_syringe_dispense_batch(self):
+    steps = [
+      {"syringe": "A", "volume": 100},
+      {"syringe": "A", "volume": 100},
+      {"syringe": "B", "volume": 250},
+    ]
+    batch = self.backend.build_syringe_dispense_batch(steps)
+    self.assertEqual(len(batch), 3)
+    self.assertEqual(batch[0], batch[1])
+    self.assertNotEqual(batch[0], batch[2])
+    for framed_command in batch:
+      self._assert_frame(framed_command, EL406StepType.SYRINGE_DISPENSE.value, 26)
+
+  async def test_prepare_manifold_wash_reuses_frame(self):
+    run = self.backend.prepare_manifold_wash(EL406PlateType.PLATE_96_WELL, cycles=3)
+    await run()
+    await run()
+    self.assertEqual(len(self.io.written_data), 2)
+    self.assertEqual(self.io.written_data[0], self.io.written_data[1])
+    self._assert_frame(self.io.written_data[0], EL406StepType.MANIFOLD_WASH.value, 102)
+
+
+class TestEL406Queries(unittest.IsolatedAsyncioTestCase):
+  """Test configuration queries against a mocked serial connection."""
+
+  async def asyncSetUp(self):
+    self.backend = _make_mock_backend(read_buffer=b"")
+    self.io = _mock_io(self.backend)
+
+  @staticmethod
+  def _query_response(command: int, payload: bytes) -> bytes:
+    body = bytes([0x00, command]) + payload
+    checksum = sum(body) & 0xFF
+    return bytes([STX]) + body + bytes([checksum, ETX])
+
+  async def test_get_washer_manifold(self):
+    self.io.set_read_buffer(self._query_response(0x10, b"\x01"))
+    manifold = await self.backend.get_washer_manifold()
+    self.assertEqual(manifold, EL406WasherManifold.MANIFOLD_96)
+
+  async def test_get_washer_manifold_unknown(self):
+    self.io.set_read_buffer(self._query_response(0x10, b"\x07"))
+    with self.assertRaises(EL406CommunicationError):
+      await self.backend.get_washer_manifold()
+
+  async def test_get_syringe_manifold(self):
+    self.io.set_read_buffer(self._query_response(0x11, b"\x02"))
+    manifold = await self.backend.get_syringe_manifold()
+    self.assertEqual(manifold, EL406SyringeManifold.MANIFOLD_192)
+
+  async def test_get_sensor_enabled(self):
+    self.io.set_read_buffer(self._query_response(0x12, b"\x01"))
+    enabled = await self.backend.get_sensor_enabled(EL406Sensor.VACUUM)
+    self.assertTrue(enabled)
+
+  async def test_get_serial_number(self):
+    self.io.set_read_buffer(self._query_response(0x16, b"406XS123\x00"))
+    serial_number = await self.backend.get_serial_number()
+    self.assertEqual(serial_number, "406XS123")
+
+
+if __name__ == "__main__":
+  unittest.main()